@@ -0,0 +1,523 @@
+import collections
+import math
+import statistics
+from typing import Any, Dict, List, Optional, Tuple
+
+from core import board
+from core import card
+from core import player
+
+
+class _Hidden(object):
+    __doc__ = """
+    What an observer knows about the face down charged Cards of a Player.
+    """
+
+    __slots__ = ('count', 'frozen_count', 'frozen_mean', 'frozen_var')
+
+    def __init__(self) -> None:
+        """
+        Initialize a _Hidden object without charged Cards
+        """
+        # Cards charged since the last reshuffle
+        self.count = 0
+        # Cards charged before the last reshuffle, with their moments
+        self.frozen_count = 0
+        self.frozen_mean = 0.0
+        self.frozen_var = 0.0
+
+    def clear(self) -> None:
+        """
+        Forget all charged Cards, used or discarded
+        """
+        self.count = 0
+        self.frozen_count = 0
+        self.frozen_mean = 0.0
+        self.frozen_var = 0.0
+
+    def get_state(self) -> Tuple[int, int, float, float]:
+        """
+        The counts and frozen moments, see set_state()
+
+        :return: Tuple[int, int, float, float], the state of the record
+        """
+        return self.count, self.frozen_count, self.frozen_mean, self.frozen_var
+
+    def set_state(self, state: Tuple[int, int, float, float]) -> None:
+        """
+        Restore a state returned by get_state()
+
+        :param state: Tuple[int, int, float, float], the state to restore
+        """
+        self.count, self.frozen_count, self.frozen_mean, self.frozen_var = \
+            state
+
+
+class BeliefTracker(object):
+    __doc__ = """
+    Incremental beliefs of an observer about hidden Cards of a Board.
+
+    The observer sees every face up Card (life, shield, attack and swapped
+    Cards, and charged Cards once used in an attack). Charged Cards are
+    drawn face down, so from the observer's view they are exchangeable
+    with the Cards still in the draw pile: both are uniform draws without
+    replacement from the unobserved Cards. The tracker keeps the count,
+    sum and sum of squares of the unobserved values, updated in O(1) per
+    Card seen, which gives the exact mean and variance of the hidden
+    charge of every opponent and of the next drawn Card.
+    When the Deck reshuffles, the moments of the Cards charged before are
+    frozen and the unobserved Cards become the whole Deck again.
+    The observer sees its own charged Cards, they are observed when drawn
+    and its charge is known exactly.
+    Quantiles use a normal approximation of the charge total.
+
+    Every update is journaled by Board move (see Board.journal_depth), so
+    Board.undo() reverts the beliefs in O(changes) instead of rebuilding
+    them. rebuild() reads the charged Cards discarded face down and the
+    charged Cards held at the last reshuffle from the Board, and keeps the
+    frozen moments, so it gives the same beliefs as the updates.
+
+        tracker = BeliefTracker.attach(board_obj, observer=bot_player)
+        tracker.attack_quantile(opponent, 0.9)
+    """
+
+    @classmethod
+    def attach(
+            cls,
+            board_obj: board.Board,
+            observer: Optional[player.Player] = None
+    ) -> 'BeliefTracker':
+        """
+        Create a BeliefTracker listening to a Board
+
+        :param board_obj: board.Board, the observed Board
+        :param observer: Optional[player.Player], the Player holding the
+            beliefs, None for a spectator
+        :return: BeliefTracker, the new BeliefTracker
+        """
+        tracker = cls(observer)
+        board_obj.add_listener(tracker)
+
+        if board_obj.players and board_obj.players[0].life_card is not None:
+            tracker.rebuild(board_obj)
+
+        return tracker
+
+    def __init__(self, observer: Optional[player.Player] = None) -> None:
+        """
+        Initialize a BeliefTracker object, see attach()
+
+        :param observer: Optional[player.Player], the Player holding the
+            beliefs, None for a spectator
+        """
+        self.observer = observer
+
+        # value counts of the whole Deck
+        self.__full: Dict[int, int] = {}
+        # value counts, number, sum and sum of squares of unobserved Cards
+        self.__unseen: Dict[int, int] = collections.Counter()
+        self.__n = 0
+        self.__sum = 0
+        self.__sum_sq = 0
+
+        self.__hidden: Dict[int, _Hidden] = {}
+
+        # changes to revert by Board move, None for moves made before the
+        # last rebuild(), which are reverted by rebuilding
+        self.__journal: List[Optional[List[Tuple]]] = []
+        self.__move: Optional[List[Tuple]] = None
+        # whether the Deck reshuffled during the action being played
+        self.__reshuffled = False
+
+    def rebuild(self, board_obj: board.Board) -> None:
+        """
+        Recompute the beliefs from the visible state of a Board, in O(Deck)
+
+        Used when Cards are dealt and after custom actions or a restored
+        checkpoint, which do not tell which Cards changed. The frozen
+        moments of the charged Cards held at the last reshuffle are kept
+        when known, else they are taken from the whole Deck, as when
+        attaching a tracker during a game.
+
+        :param board_obj: board.Board, the observed Board
+        """
+        deck_obj = board_obj.deck
+
+        self.__full = collections.Counter(
+            item.value for item in deck_obj.cards
+        )
+        self.__full.update(item.value for item in deck_obj.discard_pile)
+        self.__move = None
+        self.__reset_unseen()
+
+        # counted by value and color, multi deck shoes share Card objects
+        hidden_cards = collections.Counter(
+            (item.value, item.color)
+            for player_obj, item in board_obj.face_down
+            if player_obj is not self.observer
+        )
+        hidden_records = {}
+        for player_obj in board_obj.roster:
+            if player_obj is self.observer:
+                continue
+
+            charged = player_obj.charged_cards
+            frozen = min(
+                board_obj.charged_before_reshuffle(player_obj), len(charged)
+            )
+            hidden = self.__hidden.get(id(player_obj))
+            if hidden is None or hidden.frozen_count != frozen:
+                hidden = _Hidden()
+                hidden.frozen_count = frozen
+                hidden.frozen_mean = frozen * self.expected_draw()
+                hidden.frozen_var = self.__sample_var(frozen)
+            hidden.count = len(charged) - frozen
+            hidden_records[id(player_obj)] = hidden
+
+            hidden_cards.update(
+                (item.value, item.color) for item in charged[frozen:]
+            )
+
+        # drawn Cards are in the discard pile, the face down ones are unseen
+        for item in deck_obj.discard_pile:
+            key = (item.value, item.color)
+            if hidden_cards[key]:
+                hidden_cards[key] -= 1
+            else:
+                self.__observe(item)
+
+        self.__hidden = hidden_records
+        self.__journal = [None] * board_obj.journal_depth
+        self.__reshuffled = False
+
+    # QUERIES
+    @property
+    def unseen_count(self) -> int:
+        """
+        The number of Cards the observer has not seen since the reshuffle
+
+        :return: int, the number of unobserved Cards
+        """
+        return self.__n
+
+    def deck_distribution(self) -> Dict[int, float]:
+        """
+        The probability of each value for the next drawn Card
+
+        :return: Dict[int, float], the probability by value
+        """
+        if not self.__n:
+            return {}
+        return {
+            value: count / self.__n
+            for value, count in self.__unseen.items() if count
+        }
+
+    def expected_draw(self) -> float:
+        """
+        The expected value of the next drawn Card
+
+        :return: float, the mean unobserved value
+        """
+        return self.__sum / self.__n if self.__n else 0.0
+
+    def draw_variance(self) -> float:
+        """
+        The variance of the value of the next drawn Card
+
+        :return: float, the variance of the unobserved values
+        """
+        if not self.__n:
+            return 0.0
+        mean = self.__sum / self.__n
+        return max(self.__sum_sq / self.__n - mean * mean, 0.0)
+
+    def charged_count(self, player_obj: player.Player) -> int:
+        """
+        The number of face down charged Cards of a Player
+
+        :param player_obj: player.Player, the Player
+        :return: int, the number of charged Cards
+        """
+        if player_obj is self.observer:
+            return len(player_obj.charged_cards)
+
+        hidden = self.__hidden_of(player_obj)
+        return hidden.count + hidden.frozen_count
+
+    def expected_charge(self, player_obj: player.Player) -> float:
+        """
+        The expected total of the charged Cards of a Player
+
+        :param player_obj: player.Player, the Player
+        :return: float, the expected charge
+        """
+        if player_obj is self.observer:
+            return float(player_obj.charge)
+
+        hidden = self.__hidden_of(player_obj)
+        return hidden.frozen_mean + hidden.count * self.expected_draw()
+
+    def charge_variance(self, player_obj: player.Player) -> float:
+        """
+        The variance of the total of the charged Cards of a Player
+
+        :param player_obj: player.Player, the Player
+        :return: float, the variance of the charge
+        """
+        if player_obj is self.observer:
+            return 0.0
+
+        hidden = self.__hidden_of(player_obj)
+        return hidden.frozen_var + self.__sample_var(hidden.count)
+
+    def expected_attack(self, player_obj: player.Player) -> float:
+        """
+        The expected value of the next attack of a Player
+
+        :param player_obj: player.Player, the attacking Player
+        :return: float, the expected charge plus the expected attack Card
+        """
+        return self.expected_charge(player_obj) + self.expected_draw()
+
+    def attack_variance(self, player_obj: player.Player) -> float:
+        """
+        The variance of the value of the next attack of a Player
+
+        :param player_obj: player.Player, the attacking Player
+        :return: float, the variance of the attack
+        """
+        if player_obj is self.observer:
+            return self.__sample_var(1)
+
+        hidden = self.__hidden_of(player_obj)
+        return hidden.frozen_var + self.__sample_var(hidden.count + 1)
+
+    def attack_quantile(self, player_obj: player.Player, q: float) -> float:
+        """
+        The q quantile of the next attack of a Player
+
+        :param player_obj: player.Player, the attacking Player
+        :param q: float, the quantile, between 0 and 1 excluded
+        :return: float, the attack value not exceeded with probability q
+        """
+        mean = self.expected_attack(player_obj)
+        std = math.sqrt(self.attack_variance(player_obj))
+        if std == 0:
+            return mean
+        return statistics.NormalDist(mean, std).inv_cdf(q)
+
+    # UPDATES
+    def __call__(
+            self,
+            board_obj: board.Board,
+            event: str,
+            data: Dict[str, Any]
+    ) -> None:
+        """
+        Board listener, see board.Board.add_listener()
+        """
+        if event in ('deal', 'restore'):
+            # a new game, or a position without history
+            self.__hidden = {}
+            self.rebuild(board_obj)
+
+        elif event == 'custom':
+            self.rebuild(board_obj)
+
+        elif event == 'undo':
+            self.__on_undo(board_obj)
+
+        elif event in ('charge', 'attack', 'swap', 'reshuffle'):
+            self.__move = self.__move_of(board_obj)
+
+            if event == 'charge':
+                if data['player'] is self.observer:
+                    self.__observe(data['player'].charged_cards[-1])
+                else:
+                    self.__change_hidden(data['player']).count += 1
+
+            elif event == 'attack':
+                self.__on_attack(board_obj, data)
+
+            elif event == 'swap':
+                self.__observe(data['target'].shield_cards[data['index']])
+
+            else:
+                self.__on_reshuffle()
+
+            self.__move = None
+            # the action event comes after the reshuffles of its draws
+            self.__reshuffled = event == 'reshuffle'
+
+    def __move_of(self, board_obj: board.Board) -> Optional[List[Tuple]]:
+        """
+        The changes of the Board move in progress, None if not recorded
+        """
+        depth = board_obj.journal_depth
+        # moves beyond the Board journal were cleared or undone
+        del self.__journal[depth:]
+        if not depth:
+            return None
+
+        while len(self.__journal) < depth:
+            self.__journal.append([])
+        # None if the move was made before the last rebuild()
+        return self.__journal[-1]
+
+    def __on_undo(self, board_obj: board.Board) -> None:
+        """
+        Revert the changes of the undone moves, in O(changes)
+        """
+        depth = board_obj.journal_depth
+        undone = self.__journal[depth:]
+        del self.__journal[depth:]
+        if not undone or None in undone:
+            # moves made before the tracker knew them
+            self.rebuild(board_obj)
+            return
+
+        for changes in reversed(undone):
+            for change in reversed(changes):
+                self.__revert(change)
+
+    def __revert(self, change: Tuple) -> None:
+        """
+        Revert a single journaled change
+        """
+        kind = change[0]
+        if kind == 'observe':
+            value = change[1]
+            self.__unseen[value] += 1
+            self.__n += 1
+            self.__sum += value
+            self.__sum_sq += value * value
+
+        elif kind == 'hidden':
+            _, player_id, state = change
+            self.__hidden[player_id].set_state(state)
+
+        elif kind == 'reshuffle':
+            _, unseen, totals, states = change
+            self.__unseen = unseen
+            self.__n, self.__sum, self.__sum_sq = totals
+            for player_id, state in states.items():
+                self.__hidden[player_id].set_state(state)
+
+    def __on_attack(
+            self,
+            board_obj: board.Board,
+            data: Dict[str, Any]
+    ) -> None:
+        """
+        Observe the attack Card, the used charged Cards and new shield Cards
+        """
+        # Cards drawn before a reshuffle of the attack went back in the
+        # draw pile, only the ones drawn since are in the discard pile
+        drawn = None
+        if self.__reshuffled:
+            drawn = collections.Counter(
+                (item.value, item.color)
+                for item in board_obj.deck.discard_pile
+            )
+
+        face_up = [data['card']]
+        if data['hit_life']:
+            face_up.extend(data['target'].shield_cards)
+        for item in face_up:
+            key = (item.value, item.color)
+            if drawn is None:
+                self.__observe(item)
+            elif drawn[key]:
+                drawn[key] -= 1
+                self.__observe(item)
+
+        # charged Cards are revealed, only the ones charged since the
+        # reshuffle were taken from the unobserved Cards
+        if data['player'] is not self.observer:
+            attacker = self.__change_hidden(data['player'])
+            charged: List[card.Card] = data['charged']
+            for item in charged[len(charged) - attacker.count:]:
+                self.__observe(item)
+            attacker.clear()
+
+        if data['hit_life'] and data['target'] is not self.observer:
+            # charges are discarded face down and stay unobserved
+            self.__change_hidden(data['target']).clear()
+
+    def __on_reshuffle(self) -> None:
+        """
+        Freeze the charged Cards moments and reset the unobserved Cards
+        """
+        if self.__move is not None:
+            self.__move.append((
+                'reshuffle', self.__unseen,
+                (self.__n, self.__sum, self.__sum_sq),
+                {
+                    player_id: hidden.get_state()
+                    for player_id, hidden in self.__hidden.items()
+                }
+            ))
+
+        mean = self.expected_draw()
+        for hidden in self.__hidden.values():
+            if hidden.count:
+                hidden.frozen_mean += hidden.count * mean
+                hidden.frozen_var += self.__sample_var(hidden.count)
+                hidden.frozen_count += hidden.count
+                hidden.count = 0
+
+        self.__reset_unseen()
+
+    def __reset_unseen(self) -> None:
+        """
+        Every Card of the Deck becomes unobserved, in O(distinct values)
+        """
+        self.__unseen = collections.Counter(self.__full)
+        self.__n = sum(self.__full.values())
+        self.__sum = sum(v * c for v, c in self.__full.items())
+        self.__sum_sq = sum(v * v * c for v, c in self.__full.items())
+
+    def __observe(self, item: card.Card) -> None:
+        """
+        Remove a seen Card from the unobserved Cards, in O(1)
+        """
+        value = item.value
+        if self.__unseen[value] <= 0:
+            return
+
+        self.__unseen[value] -= 1
+        self.__n -= 1
+        self.__sum -= value
+        self.__sum_sq -= value * value
+        if self.__move is not None:
+            self.__move.append(('observe', value))
+
+    def __sample_var(self, k: int) -> float:
+        """
+        The variance of the sum of k unobserved Cards drawn without
+        replacement, with the finite population correction
+        """
+        n = self.__n
+        if k <= 0 or n <= 1:
+            return 0.0
+        k = min(k, n)
+        return k * self.draw_variance() * (n - k) / (n - 1)
+
+    def __change_hidden(self, player_obj: player.Player) -> _Hidden:
+        """
+        The hidden Cards record of a Player, journaled before a change
+        """
+        hidden = self.__hidden_of(player_obj)
+        if self.__move is not None:
+            self.__move.append(('hidden', id(player_obj), hidden.get_state()))
+        return hidden
+
+    def __hidden_of(self, player_obj: player.Player) -> _Hidden:
+        """
+        The hidden Cards record of a Player, created if needed
+        """
+        hidden = self.__hidden.get(id(player_obj))
+        if hidden is None:
+            hidden = self.__hidden[id(player_obj)] = _Hidden()
+        return hidden
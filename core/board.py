@@ -1,9 +1,17 @@
-from typing import List, Optional
-import itertools
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import random as rng
 
+from core import card
 from core import deck
 from core import player
+from core import policy
+from core.context import GameContext
+
+# signature of a custom action: function(board, player) -> need_update
+CustomAction = Callable[['Board', player.Player], bool]
+
+# signature of a listener: function(board, event, data)
+Listener = Callable[['Board', str, Dict[str, Any]], None]
 
 
 class Board(object):
@@ -14,10 +22,34 @@ class Board(object):
     Each turn it asks the current player which action they would like to perform
     and then executes the chosen action before moving on to the next player and
     repeating the process. The game ends when only one player remains.
-    """
 
-    # default player actions for the game
-    __default_actions = ['Attack', 'Charge', 'Swap', 'Custom']
+    Listeners added with add_listener() are called on every game event:
+        -> 'deal', {}
+        -> 'attack', {'player', 'target', 'value', 'card', 'charged',
+                      'damage', 'hit_life'}, hit_life is True when the
+                      attack reached the life total, even with 0 damage,
+                      the target then lost its charges and got new shields
+        -> 'charge', {'player'}
+        -> 'swap', {'player', 'target', 'index'}
+        -> 'custom', {'player', 'name'}
+        -> 'elimination', {'player'}
+        -> 'turn', {'player'}
+        -> 'undo', {'players'}
+        -> 'reshuffle', {}, before the discard pile becomes the draw pile
+        -> 'end', {'winner'}, when play() returns, winner may be None
+        -> 'restore', {}, after set_position(), the whole Board may change
+
+    Turns played with apply() are recorded in a journal of reversible
+    changes (drawn Cards, prior Player states, eliminations and turn
+    position), so search bots can revert them exactly with undo(), without
+    copying the Board. Turns played with take_turn() are only recorded if
+    record is True, a turn not recorded clears the journal.
+
+    The Board also keeps what hidden information trackers cannot see on the
+    table: the charged Cards discarded face down since the last reshuffle
+    (see face_down) and the number of charged Cards each Player held when
+    the Deck last reshuffled (see charged_before_reshuffle()).
+    """
 
     @classmethod
     def start_a_game(
@@ -35,29 +67,39 @@ class Board(object):
         for player_name in player_names:
             players.append(player.Player(player_name))
 
-        rng.shuffle(players)
+        game_context = GameContext()
+        game_context.random.shuffle(players)
 
-        board = cls(players, custom_deck=custom_deck)
-        board.turn_tracker = 0
-        board.distribute_health_card_to_all_players()
-        board.distribute_shield_cards_to_all_players()
+        board = cls(players, custom_deck=custom_deck, context=game_context)
+        board.deal()
 
-        while len(board.players) > 1:
-            board.take_turn()
-        else:
-            last_player = board.players[0].name
-            print(f'WINNER IS {last_player.upper()}, CONGRATULATIONS!')
+        last_player = board.play().name
+        print(f'WINNER IS {last_player.upper()}, CONGRATULATIONS!')
 
     def __init__(
             self,
             players : List[player.Player],
-            custom_deck: Optional[deck.Deck] = None
+            custom_deck: Optional[deck.Deck] = None,
+            default_policy: Optional[policy.Policy] = None,
+            verbose: bool = True,
+            seed: Optional[int] = None,
+            context: Optional[GameContext] = None,
+            record: bool = False
     ) -> None:
         """
         Initialize a Board object given Players
 
         :param players: List[player.Player], a list of Players to play the game
         :param custom_deck: Optional[deck.Deck], a Deck to play the game
+        :param default_policy: Optional[policy.Policy], the Policy of Players
+            without one, asks for input() if None
+        :param verbose: bool, whether to print the game events
+        :param seed: Optional[int], seeds the random generator of the game,
+            ignored if a context is given
+        :param context: Optional[GameContext], the configuration and
+            random generator of the game, a new one is created if None
+        :param record: bool, whether take_turn() records the turns for
+            undo(), apply() always records them
         """
 
         # Assert all players are of type player.Player
@@ -70,12 +112,41 @@ class Board(object):
             f'Board expected deck.Deck or None, \n\tGOT {type(custom_deck)}'
         )
 
-        self.__turn_tracker = itertools.cycle(list(range(len(players))))
+        # index in players of the next Player to play
+        self.__turn_index = 0
+        self.__turn_count = 0
+
+        # journal of played turns, each one a list of changes, see undo()
+        self.__journal: List[List[Tuple]] = []
+        self.__move: Optional[List[Tuple]] = None
+        self.record = record
 
+        self.default_policy = default_policy or policy.HumanPolicy()
+        self.verbose = verbose
+        self.context = context or GameContext(seed)
+        self.random = self.context.random
+
+        # every Player seated at the table, eliminated or not
+        self.__roster = list(players)
         self.__players = players
         self.__current_player = None
 
+        # custom actions added by rules: (name, function(board, player))
+        self.__custom_actions = []
+        self.__listeners: List[Listener] = []
+
+        # optional table.PlayerTable indexing the Players, see table.attach()
+        self.table = None
+
+        # charged Cards discarded face down since the last reshuffle, and
+        # charged Cards held by id(Player) when the Deck last reshuffled
+        self.__face_down: List[Tuple[player.Player, card.Card]] = []
+        self.__stale_charges: Dict[int, int] = {}
+
         self.__deck = custom_deck or deck.Deck.generate_default_deck()
+        self.__deck.random = self.random
+        # Cards of the Deck before any rule, restored by reset()
+        self.__base_cards = list(self.__deck.cards)
         self.__deck.shuffle()
 
         self.__discard_pile = deck.Deck()
@@ -107,6 +178,214 @@ class Board(object):
         """
         return self.__deck
 
+    @property
+    def actions(self) -> Tuple[str, ...]:
+        """
+        The names of the actions a Player can choose from
+
+        :return: Tuple[str, ...], the actions, indexed as in choose_action()
+        """
+        return self.context.actions
+
+    @property
+    def next_player(self) -> player.Player:
+        """
+        The Player who plays the next turn
+
+        :return: player.Player, the next Player
+        """
+        return self.__players[self.__turn_index]
+
+    @property
+    def turn_index(self) -> int:
+        """
+        The index in players of the Player who plays the next turn
+
+        :return: int, the index of the next Player
+        """
+        return self.__turn_index
+
+    @property
+    def turn_count(self) -> int:
+        """
+        The number of turns played since the Cards were dealt
+
+        :return: int, the number of turns played
+        """
+        return self.__turn_count
+
+    @property
+    def face_down(self) -> List[Tuple[player.Player, card.Card]]:
+        """
+        The charged Cards discarded face down since the last reshuffle
+
+        A Player hit in the life loses its charged Cards without showing
+        them. Only the Cards drawn since the last reshuffle are listed, the
+        others are no longer in the discard pile.
+
+        :return: List[Tuple[player.Player, card.Card]], the Player who
+            charged each Card and the Card, in discard order
+        """
+        return self.__face_down
+
+    def charged_before_reshuffle(self, player_obj: player.Player) -> int:
+        """
+        The number of charged Cards a Player held when the Deck reshuffled
+
+        They are the first Cards of charged_cards, the following ones were
+        drawn since the last reshuffle.
+
+        :param player_obj: player.Player, a Player of the Board
+        :return: int, the number of charged Cards drawn before the reshuffle
+        """
+        return self.__stale_charges.get(id(player_obj), 0)
+
+    @property
+    def journal_depth(self) -> int:
+        """
+        The number of moves in the journal, counting the move being recorded
+
+        Listeners use it to group their own changes by move and revert them
+        on 'undo', 0 when the current changes are not recorded.
+
+        :return: int, the number of recorded moves
+        """
+        return len(self.__journal) + (self.__move is not None)
+
+    def policy_of(self, player_obj: player.Player) -> policy.Policy:
+        """
+        The Policy taking the decisions of a given Player
+
+        :param player_obj: player.Player, a Player of the Board
+        :return: policy.Policy, the Player's Policy or the default Policy
+        """
+        return player_obj.policy or self.default_policy
+
+    def log(self, mssg: str) -> None:
+        """
+        Prints a game event if the Board is verbose
+
+        :param mssg: str, the message to print
+        """
+        if self.verbose:
+            print(mssg)
+
+    @property
+    def roster(self) -> List[player.Player]:
+        """
+        The list of all Players seated at the Board, in seating order
+
+        :return: List[player.Player], every player of the Board
+        """
+        return self.__roster
+
+    @property
+    def custom_actions(self) -> List[Tuple[str, CustomAction]]:
+        """
+        The custom actions available with the 'Custom' action
+
+        :return: List[Tuple[str, CustomAction]], the names and functions
+        """
+        return self.__custom_actions
+
+    def add_custom_action(self, name: str, action: CustomAction) -> None:
+        """
+        Add a custom action to the Board, usually from a rule
+
+        The action is called with the Board and the current Player and
+        returns whether the Player list needs an update
+
+        :param name: str, the name shown to the Players
+        :param action: CustomAction, the function performing the action
+        """
+        self.__custom_actions.append((name, action))
+
+    def add_listener(self, listener: Listener) -> None:
+        """
+        Add a function called with the Board, event name and data on events
+
+        :param listener: Listener, the function to call
+        """
+        self.__listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """
+        Remove a function added with add_listener()
+
+        :param listener: Listener, the function to remove
+        """
+        self.__listeners.remove(listener)
+
+    def emit(self, event: str, **data: Any) -> None:
+        """
+        Call all the listeners with a game event
+
+        :param event: str, the name of the event
+        :param data: Any, the data of the event
+        """
+        for listener in self.__listeners:
+            listener(self, event, data)
+
+    def reset(self, shuffle_players: bool = True) -> None:
+        """
+        Reset the Board to play a new round with the same Players and Deck
+
+        Every Player of the roster is put back in the game, the Deck is
+        refilled with the Cards it had when the Board was created and
+        shuffled, and custom actions are removed, so rules changing the Deck
+        start again from the same Cards every round.
+        No Player, Deck or list is reallocated.
+        Call deal() afterward to distribute the Cards.
+
+        :param shuffle_players: bool, whether to shuffle the seating order
+        """
+        if shuffle_players:
+            self.random.shuffle(self.__roster)
+
+        self.__players[:] = self.__roster
+        for player_obj in self.__players:
+            player_obj.reset()
+
+        self.__turn_index = 0
+        self.__turn_count = 0
+        self.__current_player = None
+        self.__custom_actions.clear()
+        self.__journal.clear()
+        self.__face_down = []
+        self.__stale_charges = {}
+
+        self.__deck.cards[:] = self.__base_cards
+        self.__deck.discard_pile.clear()
+        self.__deck.shuffle()
+
+    def deal(self) -> None:
+        """
+        Distributes health and shield Cards to all Players
+        """
+        self.distribute_health_card_to_all_players()
+        self.distribute_shield_cards_to_all_players()
+        self.__journal.clear()
+        self.emit('deal')
+
+    def play(self, max_turns: Optional[int] = None) -> Optional[player.Player]:
+        """
+        Take turns until only one Player remains
+
+        Cards must already be distributed to the Players
+
+        :param max_turns: Optional[int], stops the game after this many turns
+        :return: Optional[player.Player], the winner,
+            None if the game was stopped before having one
+        """
+        while len(self.__players) > 1:
+            if max_turns is not None and self.__turn_count >= max_turns:
+                self.emit('end', winner=None)
+                return None
+            self.take_turn()
+
+        self.emit('end', winner=self.__players[0])
+        return self.__players[0]
+
     def show_player_infos(self) -> None:
         """
         Prints the Players' visible information
@@ -122,7 +401,7 @@ class Board(object):
             return
 
         for current_player in self.players:
-            current_player.show_info()
+            current_player.show_info(self.context.format_card)
 
     # distribute cards to players
     def distribute_health_card_to_all_players(self) -> None:
@@ -140,7 +419,7 @@ class Board(object):
         :param player_obj: : player.Player, a Player to distribute a Card to
         """
 
-        player_obj.life_card = self.__deck.draw()
+        player_obj.life_card = self.draw()
 
     def distribute_shield_cards_to_all_players(self) -> None:
         """
@@ -157,7 +436,198 @@ class Board(object):
         :param player_obj: : player.Player, a Player to distribute Cards to
         """
 
-        player_obj.shield_cards = [self.__deck.draw() for _ in range(2)]
+        player_obj.shield_cards = [
+            self.draw() for _ in range(self.context.shield_count)
+        ]
+
+    # JOURNAL
+    def draw(self) -> card.Card:
+        """
+        Draws a Card from the Deck, recording it in the current move
+
+        If the draw pile is empty, the order of the discard pile and the
+        random generator state are recorded before the Deck reshuffles it.
+
+        :return: card.Card, the drawn Card
+        """
+        reshuffle = None
+        if len(self.__deck) == 0:
+            if self.__move is not None:
+                reshuffle = (
+                    self.__deck.discard_pile.copy(), self.random.getstate()
+                )
+            self.__record(('charges', self.__face_down, self.__stale_charges))
+            self.__face_down = []
+            self.__stale_charges = {
+                id(player_obj): len(player_obj.charged_cards)
+                for player_obj in self.__players if player_obj.charged_cards
+            }
+            self.emit('reshuffle')
+
+        item = self.__deck.draw()
+        self.__record(('draw', item, reshuffle))
+        return item
+
+    def __record(self, change: Tuple) -> None:
+        """
+        Add a change to the current move, if one is being recorded
+
+        :param change: Tuple, the change, its first item is its kind
+        """
+        if self.__move is not None:
+            self.__move.append(change)
+
+    def __record_player(self, player_obj: player.Player) -> None:
+        """
+        Record the state of a Player before changing it
+
+        :param player_obj: player.Player, the Player about to change
+        """
+        if self.__move is not None:
+            self.__move.append(('player', player_obj, player_obj.get_state()))
+
+    def __clear_charges(
+            self,
+            player_obj: player.Player,
+            face_down: bool
+    ) -> None:
+        """
+        Update face_down and the charges held at the last reshuffle before
+        a Player loses its charged Cards
+
+        The lists are replaced, not changed, so undo() restores them from
+        the journal.
+
+        :param player_obj: player.Player, the Player about to lose its charges
+        :param face_down: bool, whether the Cards are discarded face down,
+            else they were revealed by an attack
+        """
+        stale = self.__stale_charges.get(id(player_obj), 0)
+        lost = player_obj.charged_cards[stale:] if face_down else []
+        if not stale and not lost:
+            return
+
+        self.__record(('charges', self.__face_down, self.__stale_charges))
+        if stale:
+            self.__stale_charges = dict(self.__stale_charges)
+            del self.__stale_charges[id(player_obj)]
+        if lost:
+            self.__face_down = self.__face_down + [
+                (player_obj, item) for item in lost
+            ]
+
+    def __begin_move(self, force: bool = False) -> bool:
+        """
+        Start recording a move, unless one is already being recorded or
+        recording is off
+
+        :param force: bool, record even if record is False, for apply()
+        :return: bool, whether a new move was started
+        """
+        if self.__move is not None or not (force or self.record):
+            return False
+
+        self.__move = []
+        return True
+
+    def __end_move(self, started: bool) -> None:
+        """
+        Add the recorded move to the journal, if it was started by the caller
+
+        :param started: bool, the value returned by __begin_move()
+        """
+        if started:
+            self.__journal.append(self.__move)
+            self.__move = None
+
+    def undo(self) -> bool:
+        """
+        Revert the last turn or action recorded in the journal
+
+        Restores the drawn Cards, the Players' states, the eliminated Players
+        and the turn position, in O(number of changes).
+        Turns with a custom action cannot be undone and clear the journal.
+
+        :return: bool, whether a move was reverted
+        """
+        if not self.__journal:
+            return False
+
+        touched = []
+        for change in reversed(self.__journal.pop()):
+            kind = change[0]
+
+            if kind == 'player':
+                _, player_obj, state = change
+                player_obj.set_state(state)
+                touched.append(player_obj)
+
+            elif kind == 'draw':
+                _, item, reshuffle = change
+                self.__deck.undraw(item)
+                if reshuffle is not None:
+                    discard_pile, random_state = reshuffle
+                    self.__deck.cards = []
+                    self.__deck.discard_pile = discard_pile
+                    self.random.setstate(random_state)
+
+            elif kind == 'eliminate':
+                _, index, player_obj = change
+                self.__players.insert(index, player_obj)
+                touched.append(player_obj)
+
+            elif kind == 'turn':
+                _, self.__turn_index, self.__turn_count, \
+                    self.__current_player = change
+
+            elif kind == 'charges':
+                _, self.__face_down, self.__stale_charges = change
+
+        self.emit('undo', players=touched)
+        return True
+
+    def set_position(
+            self,
+            roster: List[player.Player],
+            players: List[player.Player],
+            turn_index: int,
+            turn_count: int,
+            face_down: Optional[List[Tuple[player.Player, card.Card]]] = None,
+            charged_before_reshuffle: Optional[List[int]] = None
+    ) -> None:
+        """
+        Restore the seating and turn position of a saved game
+
+        The Players and the Deck must already hold their saved Cards, see
+        checkpoint.restore(). The journal is cleared.
+
+        :param roster: List[player.Player], every Player in seating order
+        :param players: List[player.Player], the Players still in the game
+        :param turn_index: int, the index in players of the next Player
+        :param turn_count: int, the number of turns played
+        :param face_down: Optional[List[Tuple[player.Player, card.Card]]],
+            the charged Cards discarded face down since the last reshuffle,
+            see face_down
+        :param charged_before_reshuffle: Optional[List[int]], the charged
+            Cards of each Player of the roster held at the last reshuffle,
+            see charged_before_reshuffle()
+        """
+        self.__roster[:] = roster
+        self.__players[:] = players
+        self.__turn_index = turn_index
+        self.__turn_count = turn_count
+        self.__face_down = list(face_down or [])
+        self.__stale_charges = {
+            id(player_obj): count
+            for player_obj, count in zip(
+                roster, charged_before_reshuffle or []
+            )
+            if count
+        }
+        self.__current_player = None
+        self.__move = None
+        self.__journal.clear()
+        self.emit('restore')
 
     # GAME ACTIONS
     def attack(self, player1: player.Player, player2: player.Player) -> None:
@@ -171,19 +641,27 @@ class Board(object):
         :param player2: player.Player, the attacked Player.
         """
 
+        started = self.__begin_move()
+        self.__record_player(player1)
+        self.__record_player(player2)
+
         # Count the attack value
-        attack_card = self.deck.draw()
+        attack_card = self.draw()
+        charged_cards = player1.charged_cards
         charged_value = player1.charge
         attack_value = attack_card.value + charged_value
+        self.__clear_charges(player1, face_down=False)
         player1.reset_charges()
+        damage = 0
+        hit_life = False
 
-        print(
+        self.log(
             f'{player1.name.upper()} attacking '
             f'{player2.name.upper()} for {attack_value}'
         )
         # Count the remainder after shield calculations
         remainder = player2.shield - attack_value
-        print(
+        self.log(
             f' -> Hit {player2.name.upper()}\'s Shield: {player2.shield} '
             f'- {attack_value} = {remainder}'
         )
@@ -194,15 +672,25 @@ class Board(object):
         else:
             life_copy = player2.life
             player2.life += remainder
+            damage = -remainder
+            hit_life = True
 
-            print(
+            self.log(
                 f' -> Hit Life : {life_copy} - {-remainder} = {player2.life}'
             )
 
+            self.__clear_charges(player2, face_down=True)
             player2.reset_charges()
 
             self.distribute_shield_cards(player2)
-            print(f' -> {player2.life = }\n- {player2.shield = }')
+            self.log(f' -> {player2.life = }\n- {player2.shield = }')
+
+        self.__end_move(started)
+        self.emit(
+            'attack', player=player1, target=player2, value=attack_value,
+            card=attack_card, charged=charged_cards, damage=damage,
+            hit_life=hit_life
+        )
 
     def charge(self, player1: player.Player) -> None:
         """
@@ -214,10 +702,21 @@ class Board(object):
 
         :param player1: player.Player, the Player charging an attack Card
         """
-        print(f'{player1.name.upper()} is charging an attack card')
-        player1.charged_cards = self.deck.draw()
+        self.log(f'{player1.name.upper()} is charging an attack card')
+
+        started = self.__begin_move()
+        self.__record_player(player1)
+        player1.charged_cards = self.draw()
 
-    def swap(self, player1: player.Player, player2: player.Player) -> None:
+        self.__end_move(started)
+        self.emit('charge', player=player1)
+
+    def swap(
+            self,
+            player1: player.Player,
+            player2: player.Player,
+            card_choice: Optional[int] = None
+    ) -> None:
         """
         Perform the swap action for given Player.
 
@@ -226,20 +725,22 @@ class Board(object):
 
         :param player1: player.Player, the swapping Player.
         :param player2: player.Player, the swapped Player.
+        :param card_choice: Optional[int], the index of the shield Card to
+            swap, asked to the Policy of player1 if None
         """
-        swap_card = self.deck.draw()
+        started = self.__begin_move()
+        self.__record_player(player2)
+        swap_card = self.draw()
 
         copy_cards = player2.shield_cards.copy()
-        swap_mssg = '\n\t'.join(
-            f'-> {k}-{v}' for k, v in enumerate(copy_cards)
-        )
-
-        card_choice = int(input(
-            f'Choose a shield card to swap:\n\t{swap_mssg}\nChoice:'
-        ))
-        print(
+        if card_choice is None:
+            card_choice = self.policy_of(player1).choose_shield(
+                self, player1, player2
+            )
+        self.log(
             f'{player1.name.upper()} is swapping {player2.name.upper()} shield:'
-            f'\n\tFrom {copy_cards[card_choice]} to {swap_card}'
+            f'\n\tFrom {self.context.format_card(copy_cards[card_choice])} '
+            f'to {self.context.format_card(swap_card)}'
         )
         new_shield = []
         for i, card in enumerate(player2.shield_cards):
@@ -250,6 +751,9 @@ class Board(object):
 
         player2.shield_cards = new_shield
 
+        self.__end_move(started)
+        self.emit('swap', player=player1, target=player2, index=card_choice)
+
     # GAME LOOP
     def choose_player(
             self,
@@ -263,45 +767,38 @@ class Board(object):
         :param full: bool, whether to include the current Player in the choice
         :return: player.Player, the chosen Player
         """
-        player_copy = self.players.copy()
-
-        if not full:
-            player_copy.remove(player1)
-
-        player_mssg = '\n\t'.join(
-            f'-> {k}-{v.name}' for k, v in enumerate(player_copy)
-        )
-        player_choice = input(
-            f'Choose an opponent :\n\t{player_mssg}\nChoice:'
-        )
-        return player_copy[int(player_choice)]
+        return self.policy_of(player1).choose_player(self, player1, full)
 
     def update_players(self, player_index: int) -> None:
         """
         Update Player's list at the end of a turn if an update is needed
 
         If a Player has a life total less than 0, they are removed from the game
-        Updates the __turn_tracker
+        Updates the index of the next Player to play
         :param player_index: int, the current Player index
         """
 
-        is_before = True
-        for i, player_obj in enumerate(reversed(self.__players)):
-
-            if i > player_index:
-                is_before = False
-
+        current = self.__players[player_index]
+        removed_before = 0
+        for i in range(len(self.__players) - 1, -1, -1):
+            player_obj = self.__players[i]
             if player_obj.life > 0:
                 continue
 
-            print(f'PLAYER KILLED: {player_obj.name}')
-            self.__players.remove(player_obj)
+            self.log(f'PLAYER KILLED: {player_obj.name}')
+            del self.__players[i]
+            self.__record(('eliminate', i, player_obj))
+            self.emit('elimination', player=player_obj)
 
-        player_index -= 1 if is_before else 0
-        self.__turn_tracker = itertools.cycle(list(range(len(self.__players))))
+            if i < player_index:
+                removed_before += 1
 
-        for i in range(player_index+1):
-            next(self.__turn_tracker)
+        # the next Player sits right after the current one, if still playing
+        next_index = player_index - removed_before
+        if current.life > 0:
+            next_index += 1
+
+        self.__turn_index = next_index % max(len(self.__players), 1)
 
     def choose_action(self) -> bool:
         """
@@ -309,31 +806,60 @@ class Board(object):
 
         :return bool, whether the Player list needs an update after an attack
         """
-        action_mssg = f'\n\t'.join(
-            f'-> {k}-{v}' for k, v in enumerate(self.__default_actions)
-        )
+        player_policy = self.policy_of(self.current_player)
+        action = player_policy.choose_action(self, self.current_player)
 
-        action = int(input(
-            f'\n{self.current_player.name} - '
-            f'Choose an action number :\n\t{action_mssg}\nChoice:'
-        ))
+        target = None
+        if action == 0:  # attack
+            target = self.choose_player(self.current_player)
+
+        elif action == 2:  # swap shield
+            target = self.choose_player(self.current_player, full=True)
+
+        elif action == 3 and not self.__custom_actions:
+            self.log('NO CUSTOM ACTIONS, CHOOSE AGAIN...')
+            return self.choose_action()
+
+        return self.perform(action, target)
 
+    def perform(
+            self,
+            action: int,
+            target: Optional[player.Player] = None,
+            index: Optional[int] = None
+    ) -> bool:
+        """
+        Perform an action for the current Player
+
+        :param action: int, the index of the action in actions
+        :param target: Optional[player.Player], the attacked or swapped Player
+        :param index: Optional[int], the shield Card index for a swap or
+            the custom action index, asked to the Policy if None
+        :return bool, whether the Player list needs an update after an attack
+        """
         need_update = False
         if action == 0:  # attack
-            attacked_player = self.choose_player(self.current_player)
-            self.attack(self.current_player, attacked_player)
-            need_update = attacked_player.life <= 0
+            self.attack(self.current_player, target)
+            need_update = target.life <= 0
 
         elif action == 1:  # charge
             self.charge(self.current_player)
 
         elif action == 2:  # swap shield
-            swap_player = self.choose_player(self.current_player, full=True)
-            self.swap(self.current_player, swap_player)
+            self.swap(self.current_player, target, index)
 
         elif action == 3:
-            print('NO CUSTOM ACTIONS, CHOOSE AGAIN...')
-            return self.choose_action()
+            if index is None:
+                index = self.policy_of(self.current_player) \
+                    .choose_custom_action(self, self.current_player)
+
+            name, custom_action = self.__custom_actions[index]
+            need_update = custom_action(self, self.current_player)
+
+            # custom actions are not recorded, they cannot be undone
+            self.__move = None
+            self.__journal.clear()
+            self.emit('custom', player=self.current_player, name=name)
 
         return need_update
 
@@ -341,15 +867,65 @@ class Board(object):
         """
         Process the turn of the current Player
         """
-        self.show_player_infos()
+        if self.verbose:
+            self.show_player_infos()
+
+        self.__play_turn(None)
+
+    def apply(
+            self,
+            action: int,
+            target: Optional[player.Player] = None,
+            index: Optional[int] = None
+    ) -> None:
+        """
+        Play the next Player's turn with the given decisions
 
-        current_player_index = next(self.__turn_tracker)
+        The turn is recorded in the journal and can be reverted with undo()
+
+        :param action: int, the index of the action in actions
+        :param target: Optional[player.Player], the attacked or swapped Player
+        :param index: Optional[int], the shield Card index for a swap or
+            the custom action index
+        """
+        self.__play_turn((action, target, index))
+
+    def __play_turn(self, decision: Optional[Tuple]) -> None:
+        """
+        Play the next Player's turn, recorded in the journal if decided by
+        apply() or if record is True
+
+        :param decision: Optional[Tuple], the (action, target, index) to
+            perform, asked to the Player's Policy if None
+        """
+        started = self.__begin_move(force=decision is not None)
+        if not started and self.__move is None:
+            # earlier moves cannot be undone across a turn not recorded
+            self.__journal.clear()
+        self.__record((
+            'turn', self.__turn_index, self.__turn_count,
+            self.__current_player
+        ))
+
+        current_player_index = self.__turn_index
         self.__current_player = self.players[current_player_index]
 
-        need_update = self.choose_action()
+        if decision is None:
+            need_update = self.choose_action()
+        else:
+            need_update = self.perform(*decision)
 
         if need_update:
             self.update_players(current_player_index)
+        else:
+            self.__turn_index = (
+                (current_player_index + 1) % len(self.__players)
+            )
+
+        self.__turn_count += 1
+        if self.__move is not None:
+            self.__end_move(started)
+        self.emit('turn', player=self.__current_player)
 
 
 if __name__ == "__main__":
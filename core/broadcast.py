@@ -0,0 +1,350 @@
+import collections
+import struct
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from core import board
+from core import player
+
+# fields of a change, see Broadcaster
+LIFE, SHIELD, SLOT, SLOT_COUNT, CHARGES, ELIMINATED = range(6)
+
+# frame header: turn count, number of changes
+_HEADER = struct.Struct('<IH')
+# change header: seat, field
+_CHANGE = struct.Struct('<HB')
+_INT = struct.Struct('<i')
+# counts are unbounded, charged Cards pile up with long charging streaks
+_COUNT = struct.Struct('<I')
+# elimination flag, False when Board.undo() puts a Player back in the game
+_FLAG = struct.Struct('<?')
+# shield slot: slot index, card value, color length (color bytes follow)
+_SLOT = struct.Struct('<HhB')
+
+# key of a change: (seat, field, slot index or 0)
+ChangeKey = Tuple[int, int, int]
+
+
+def encode(turn: int, delta: Dict[ChangeKey, Any]) -> bytes:
+    """
+    Encode a delta as a compact frame
+
+    :param turn: int, the turn count of the delta
+    :param delta: Dict[ChangeKey, Any], the new value of each changed field
+    :return: bytes, the encoded frame
+    """
+    chunks = [_HEADER.pack(turn, len(delta))]
+    for (seat, field, slot), value in delta.items():
+        chunks.append(_CHANGE.pack(seat, field))
+
+        if field in (LIFE, SHIELD):
+            chunks.append(_INT.pack(value))
+        elif field in (SLOT_COUNT, CHARGES):
+            chunks.append(_COUNT.pack(value))
+        elif field == SLOT:
+            card_value, color = value
+            color = color.encode()
+            chunks.append(_SLOT.pack(slot, card_value, len(color)))
+            chunks.append(color)
+        elif field == ELIMINATED:
+            chunks.append(_FLAG.pack(value))
+
+    return b''.join(chunks)
+
+
+def decode(frame: bytes) -> Tuple[int, List[Tuple[int, int, int, Any]]]:
+    """
+    Decode a frame created by encode()
+
+    :param frame: bytes, the encoded frame
+    :return: Tuple[int, List], the turn count and the list of changes
+        as (seat, field, slot, value)
+    """
+    turn, n_changes = _HEADER.unpack_from(frame)
+    offset = _HEADER.size
+
+    changes = []
+    for _ in range(n_changes):
+        seat, field = _CHANGE.unpack_from(frame, offset)
+        offset += _CHANGE.size
+
+        slot, value = 0, None
+        if field in (LIFE, SHIELD):
+            value, = _INT.unpack_from(frame, offset)
+            offset += _INT.size
+        elif field in (SLOT_COUNT, CHARGES):
+            value, = _COUNT.unpack_from(frame, offset)
+            offset += _COUNT.size
+        elif field == SLOT:
+            slot, card_value, length = _SLOT.unpack_from(frame, offset)
+            offset += _SLOT.size
+            color = frame[offset:offset + length].decode()
+            offset += length
+            value = (card_value, color)
+        elif field == ELIMINATED:
+            value, = _FLAG.unpack_from(frame, offset)
+            offset += _FLAG.size
+
+        changes.append((seat, field, slot, value))
+
+    return turn, changes
+
+
+class Subscriber(object):
+    __doc__ = """
+    Bounded queue of frames for a single viewer of a Broadcaster.
+
+    When the queue is full, a new delta is either merged in the last
+    pending frame (overflow='coalesce', the viewer still ends up with the
+    right state) or the oldest frame is dropped (overflow='drop').
+    """
+
+    def __init__(self, maxlen: int = 64, overflow: str = 'coalesce') -> None:
+        """
+        Initialize a Subscriber object
+
+        :param maxlen: int, the maximum number of pending frames
+        :param overflow: str, 'coalesce' or 'drop', what to do when full
+        """
+        if overflow not in ('coalesce', 'drop'):
+            raise ValueError(
+                f'overflow must be "coalesce" or "drop", got {overflow!r}, '
+                f'aborting...'
+            )
+
+        self.__maxlen = maxlen
+        self.__overflow = overflow
+        # pending (turn, delta, frame), the frame is shared between viewers
+        self.__queue: Deque[Tuple[int, Dict, bytes]] = collections.deque()
+
+        self.dropped = 0
+        self.coalesced = 0
+
+    def push(
+            self,
+            turn: int,
+            delta: Dict[ChangeKey, Any],
+            frame: bytes
+    ) -> None:
+        """
+        Queue an encoded delta
+
+        :param turn: int, the turn count of the delta
+        :param delta: Dict[ChangeKey, Any], the delta
+        :param frame: bytes, the encoded delta
+        """
+        if len(self.__queue) < self.__maxlen:
+            self.__queue.append((turn, delta, frame))
+
+        elif self.__overflow == 'coalesce':
+            _, last_delta, _ = self.__queue.pop()
+            merged = {**last_delta, **delta}
+            self.__queue.append((turn, merged, encode(turn, merged)))
+            self.coalesced += 1
+
+        else:
+            self.__queue.popleft()
+            self.__queue.append((turn, delta, frame))
+            self.dropped += 1
+
+    def get(self) -> Optional[bytes]:
+        """
+        Pop the oldest pending frame
+
+        :return: Optional[bytes], the frame, None if nothing is pending
+        """
+        if not self.__queue:
+            return None
+        return self.__queue.popleft()[2]
+
+    def __len__(self) -> int:
+        """
+        The number of pending frames
+
+        :return: int, the number of pending frames
+        """
+        return len(self.__queue)
+
+
+class Broadcaster(object):
+    __doc__ = """
+    Broadcasts the state changes of a Board to many Subscribers.
+
+    The Broadcaster listens to the Board events, keeps the last broadcast
+    state of each seat and, at the end of every turn, compares it with the
+    Players touched during the turn only. The changes (life, shield,
+    shield slots, charge counts and eliminations) are encoded once and the
+    same frame is queued for every Subscriber. A Player put back in the
+    game by Board.undo() is sent as ELIMINATED with the value False.
+    Seats are the index of the Players in Board.roster when Cards are dealt.
+
+        broadcaster = Broadcaster()
+        board_obj.add_listener(broadcaster)
+        viewer = broadcaster.subscribe()
+        frame = viewer.get()
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize a Broadcaster object
+        """
+        self.__subscribers: List[Subscriber] = []
+
+        self.__seats: Dict[int, int] = {}
+        # last broadcast value of every (seat, field, slot)
+        self.__state: Dict[ChangeKey, Any] = {}
+        self.__touched: Dict[int, player.Player] = {}
+        self.__all_touched = False
+        # seat -> eliminated, status changes sent with the next frame
+        self.__pending_status: Dict[int, bool] = {}
+
+    @property
+    def subscribers(self) -> List[Subscriber]:
+        """
+        The current Subscribers
+
+        :return: List[Subscriber], the Subscribers
+        """
+        return self.__subscribers
+
+    def subscribe(
+            self,
+            maxlen: int = 64,
+            overflow: str = 'coalesce'
+    ) -> Subscriber:
+        """
+        Add a new Subscriber, its first frame is the full current state
+
+        :param maxlen: int, the maximum number of pending frames
+        :param overflow: str, 'coalesce' or 'drop', what to do when full
+        :return: Subscriber, the new Subscriber
+        """
+        subscriber = Subscriber(maxlen, overflow)
+        if self.__state:
+            state = dict(self.__state)
+            subscriber.push(0, state, encode(0, state))
+
+        self.__subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """
+        Remove a Subscriber
+
+        :param subscriber: Subscriber, the Subscriber to remove
+        """
+        self.__subscribers.remove(subscriber)
+
+    def __call__(
+            self,
+            board_obj: board.Board,
+            event: str,
+            data: Dict[str, Any]
+    ) -> None:
+        """
+        Board listener, see board.Board.add_listener()
+        """
+        if event in ('deal', 'restore'):
+            self.__seats = {
+                id(player_obj): seat
+                for seat, player_obj in enumerate(board_obj.roster)
+            }
+            self.__state.clear()
+            self.__touched.clear()
+            self.__pending_status.clear()
+            self.__all_touched = True
+
+            # a restored game may already have eliminated Players
+            playing = {id(player_obj) for player_obj in board_obj.players}
+            for player_obj in board_obj.roster:
+                if id(player_obj) not in playing:
+                    seat = self.__seats[id(player_obj)]
+                    self.__state[(seat, ELIMINATED, 0)] = True
+                    self.__pending_status[seat] = True
+
+        elif event == 'custom':
+            # custom actions can change any Player
+            self.__all_touched = True
+
+        elif event == 'turn':
+            self.__publish(board_obj)
+
+        elif event == 'undo':
+            playing = {id(player_obj) for player_obj in board_obj.players}
+            for player_obj in data['players']:
+                self.__touched[id(player_obj)] = player_obj
+
+                # the undone move may have eliminated this Player
+                seat = self.__seats[id(player_obj)]
+                if id(player_obj) in playing and \
+                        self.__state.pop((seat, ELIMINATED, 0), False):
+                    self.__pending_status[seat] = False
+
+        else:
+            for key in ('player', 'target'):
+                player_obj = data.get(key)
+                if player_obj is not None:
+                    self.__touched[id(player_obj)] = player_obj
+
+            if event == 'elimination':
+                seat = self.__seats[id(data['player'])]
+                self.__touched.pop(id(data['player']), None)
+                self.__state[(seat, ELIMINATED, 0)] = True
+                self.__pending_status[seat] = True
+
+    def __publish(self, board_obj: board.Board) -> None:
+        """
+        Compute the delta of the turn and queue it for every Subscriber
+
+        :param board_obj: board.Board, the Board of the game
+        """
+        if self.__all_touched:
+            touched = board_obj.players
+            self.__all_touched = False
+        else:
+            touched = self.__touched.values()
+
+        delta = {}
+        for player_obj in touched:
+            self.__diff(self.__seats[id(player_obj)], player_obj, delta)
+        self.__touched.clear()
+
+        for seat, eliminated in self.__pending_status.items():
+            delta[(seat, ELIMINATED, 0)] = eliminated
+        self.__pending_status.clear()
+
+        if not delta:
+            return
+
+        frame = encode(board_obj.turn_count, delta)
+        for subscriber in self.__subscribers:
+            subscriber.push(board_obj.turn_count, delta, frame)
+
+    def __diff(
+            self,
+            seat: int,
+            player_obj: player.Player,
+            delta: Dict[ChangeKey, Any]
+    ) -> None:
+        """
+        Add the changed fields of a Player to a delta
+
+        :param seat: int, the seat of the Player
+        :param player_obj: player.Player, the Player to compare
+        :param delta: Dict[ChangeKey, Any], the delta to fill
+        """
+        state = self.__state
+        values = [
+            ((seat, LIFE, 0), player_obj.life),
+            ((seat, SHIELD, 0), player_obj.shield),
+            ((seat, SLOT_COUNT, 0), len(player_obj.shield_cards)),
+            ((seat, CHARGES, 0), len(player_obj.charged_cards)),
+        ]
+        values.extend(
+            ((seat, SLOT, i), (item.value, item.color))
+            for i, item in enumerate(player_obj.shield_cards)
+        )
+
+        for key, value in values:
+            if state.get(key) != value:
+                state[key] = value
+                delta[key] = value
@@ -0,0 +1,283 @@
+import collections
+import hashlib
+import os
+import struct
+import tempfile
+from typing import Dict, Iterable, List, Optional
+
+from core import policy
+from core import runner
+
+# bumped when the rules of the engine change, invalidates cached results
+ENGINE_VERSION = 2
+
+# chunk file header: magic, format version, engine version, slot count
+_HEADER = struct.Struct('<4sHHI')
+_MAGIC = b'BCRC'
+_FORMAT_VERSION = 1
+# one slot per seed of a chunk: winner seat and number of turns
+_SLOT = struct.Struct('<hI')
+# winner values of a slot without winner, and of a seed not played yet
+_NO_WINNER = -1
+_MISSING = -2
+
+
+def policy_id(policy_obj: policy.Policy) -> str:
+    """
+    The identifier of a Policy in cache keys
+
+    :param policy_obj: policy.Policy, the Policy
+    :return: str, the class, name and version of the Policy
+    """
+    cls = policy_obj.__class__
+    return (
+        f'{cls.__module__}.{cls.__qualname__}:'
+        f'{policy_obj.name}:{policy_obj.version}'
+    )
+
+
+def job_key(job: runner.GameJob) -> str:
+    """
+    The content address of the games of a GameJob
+
+    Hash of the engine version, the composition of the Deck (the count
+    of each Card, whatever their order), the policy ids of the seats,
+    max_turns and shield_count: two GameJobs with the same key play the
+    same game for every seed. The order of the Deck is ignored as the Board
+    shuffles it with the seeded GameContext, so a deck_factory returning
+    shuffled Decks keeps the same key.
+
+    :param job: runner.GameJob, the job
+    :return: str, the hexadecimal sha256 of the job
+    """
+    counts = collections.Counter(
+        (item.value, item.color) for item in job.deck_factory().cards
+    )
+    cards = ','.join(
+        f'{value}:{color}x{count}'
+        for (value, color), count in sorted(counts.items())
+    )
+    description = '|'.join((
+        f'engine={ENGINE_VERSION}',
+        f'deck={cards}',
+        f'players={len(job.policies)}',
+        'policies=' + ','.join(map(policy_id, job.policies)),
+        f'max_turns={job.max_turns}',
+        f'shield_count={job.shield_count}',
+    ))
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+class ResultCache(object):
+    __doc__ = """
+    Content addressed on disk cache of GameResults.
+
+    Results are stored in chunks of chunk_size consecutive seeds, one file
+    per chunk named by the hash of the job key and the chunk index, with a
+    6 bytes slot per seed. run() loads the chunks of the requested seeds,
+    plays only the missing seeds and writes the updated chunks back.
+    Reading a chunk touches its file, and when the cache grows beyond
+    max_bytes the least recently used chunks are deleted.
+
+        cache = ResultCache('~/.cache/bouclier')
+        results = cache.run(job, range(100_000))
+        sweep = Sweep(..., backend=cache.run)
+    """
+
+    def __init__(
+            self,
+            directory: str,
+            max_bytes: int = 256 * 1024 * 1024,
+            chunk_size: int = 1_024,
+            max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Initialize a ResultCache object
+
+        :param directory: str, the directory of the chunk files, created
+            if needed
+        :param max_bytes: int, the maximum size of the chunk files
+        :param chunk_size: int, the number of seeds of a chunk
+        :param max_workers: Optional[int], the threads playing missing
+            seeds, see runner.run_games()
+        """
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def run(
+            self,
+            job: runner.GameJob,
+            seeds: Iterable[int]
+    ) -> List[runner.GameResult]:
+        """
+        Return the results of a GameJob, playing only uncached seeds
+
+        :param job: runner.GameJob, the games to play
+        :param seeds: Iterable[int], the seed of each game, not negative
+        :return: List[runner.GameResult], the outcome of each game, in the
+            order of the seeds
+        """
+        seeds = list(seeds)
+        key = job_key(job)
+
+        chunks: Dict[int, List[Optional[runner.GameResult]]] = {}
+        for seed in seeds:
+            index = seed // self.chunk_size
+            if index not in chunks:
+                chunks[index] = self.__read_chunk(key, index)
+
+        missing = sorted({
+            seed for seed in seeds
+            if chunks[seed // self.chunk_size][seed % self.chunk_size] is None
+        })
+        self.misses += len(missing)
+        self.hits += len(seeds) - len(missing)
+
+        if missing:
+            played = runner.run_games(job, missing, self.max_workers)
+            changed = set()
+            for result in played:
+                index = result.seed // self.chunk_size
+                chunks[index][result.seed % self.chunk_size] = result
+                changed.add(index)
+
+            for index in changed:
+                self.__write_chunk(key, index, chunks[index])
+            self.evict()
+
+        return [
+            chunks[seed // self.chunk_size][seed % self.chunk_size]
+            for seed in seeds
+        ]
+
+    def evict(self) -> int:
+        """
+        Delete the least recently used chunks until the cache fits in
+        max_bytes
+
+        :return: int, the number of deleted chunks
+        """
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.chunk'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in files)
+        deleted = 0
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            deleted += 1
+
+        return deleted
+
+    def clear(self) -> None:
+        """
+        Delete every chunk of the cache
+        """
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.chunk'):
+                os.remove(entry.path)
+
+    def __path(self, key: str, index: int) -> str:
+        """
+        The file of a chunk, addressed by the job key and the chunk index
+        """
+        name = hashlib.sha256(
+            f'{key}:{self.chunk_size}:{index}'.encode()
+        ).hexdigest()
+        return os.path.join(self.directory, f'{name}.chunk')
+
+    def __read_chunk(
+            self,
+            key: str,
+            index: int
+    ) -> List[Optional[runner.GameResult]]:
+        """
+        The results of a chunk, None for missing seeds, touches the file
+
+        Unreadable or outdated files are considered empty chunks.
+        """
+        results: List[Optional[runner.GameResult]] = [None] * self.chunk_size
+        path = self.__path(key, index)
+        try:
+            with open(path, 'rb') as chunk_file:
+                data = chunk_file.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return results
+
+        if len(data) != _HEADER.size + self.chunk_size * _SLOT.size:
+            return results
+        magic, format_version, engine, count = _HEADER.unpack_from(data)
+        if (magic, format_version, engine, count) != (
+                _MAGIC, _FORMAT_VERSION, ENGINE_VERSION, self.chunk_size
+        ):
+            return results
+
+        first_seed = index * self.chunk_size
+        slots = _SLOT.iter_unpack(memoryview(data)[_HEADER.size:])
+        for i, (winner, turns) in enumerate(slots):
+            if winner != _MISSING:
+                results[i] = runner.GameResult(
+                    first_seed + i,
+                    None if winner == _NO_WINNER else winner,
+                    turns
+                )
+
+        return results
+
+    def __write_chunk(
+            self,
+            key: str,
+            index: int,
+            results: List[Optional[runner.GameResult]]
+    ) -> None:
+        """
+        Write the results of a chunk atomically
+        """
+        data = bytearray(_HEADER.pack(
+            _MAGIC, _FORMAT_VERSION, ENGINE_VERSION, self.chunk_size
+        ))
+        for result in results:
+            if result is None:
+                data += _SLOT.pack(_MISSING, 0)
+            elif result.winner is None:
+                data += _SLOT.pack(_NO_WINNER, result.turns)
+            else:
+                data += _SLOT.pack(result.winner, result.turns)
+
+        # a concurrent reader sees the old or the new chunk, never a part
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as chunk_file:
+            chunk_file.write(data)
+        os.replace(temp_path, self.__path(key, index))
+
+
+if __name__ == '__main__':
+
+    import time
+
+    demo_cache = ResultCache(tempfile.mkdtemp())
+    demo_job = runner.GameJob([policy.RandomPolicy() for _ in range(4)])
+
+    for attempt in ('cold', 'warm'):
+        start = time.perf_counter()
+        demo_cache.run(demo_job, range(5_000))
+        print(
+            f'{attempt} run: {time.perf_counter() - start:.2f}s, '
+            f'hits={demo_cache.hits} misses={demo_cache.misses}'
+        )
@@ -8,6 +8,10 @@ class Card(object):
     any value over this threshold is considered a face card.
     """
 
+    # Cards are shared between Boards (see deck.DeckSpec), so they cannot
+    # hold per game settings: these are the defaults of a GameContext and
+    # of Cards shown outside of a game, a Board reads its GameContext
+
     # Threshold to count a value as a face card
     face_card = 11
 
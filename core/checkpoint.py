@@ -0,0 +1,446 @@
+import concurrent.futures
+import os
+import struct
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core import board
+from core import cache
+from core import card
+from core import player
+from core import runner
+
+# checkpoint magic, followed by the format and engine versions
+_MAGIC = b'BCKP'
+FORMAT_VERSION = 2
+
+# code of an empty Card slot, such as the life Card of a Player not dealt
+_NO_CARD = 0xFFFF
+
+# progress file record: seed, winner seat (-1 without winner), turns
+_RECORD = struct.Struct('<qhI')
+_PROGRESS = 'progress.bin'
+
+
+class _Writer(object):
+    __doc__ = """
+    Little endian binary buffer used to write a checkpoint.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty _Writer object
+        """
+        self.data = bytearray()
+
+    def pack(self, fmt: str, *values: Any) -> None:
+        """
+        Append values packed with a struct format
+        """
+        self.data += struct.pack('<' + fmt, *values)
+
+    def text(self, value: str) -> None:
+        """
+        Append a string, prefixed by its length
+        """
+        encoded = value.encode()
+        self.pack('H', len(encoded))
+        self.data += encoded
+
+    def codes(self, codes: List[int]) -> None:
+        """
+        Append a list of Card codes, prefixed by its length
+        """
+        self.pack(f'I{len(codes)}H', len(codes), *codes)
+
+
+class _Reader(object):
+    __doc__ = """
+    Little endian binary buffer used to read a checkpoint.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        """
+        Initialize a _Reader object at the start of the data
+        """
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, fmt: str) -> Tuple:
+        """
+        Read values packed with a struct format
+        """
+        fmt = '<' + fmt
+        values = struct.unpack_from(fmt, self.data, self.offset)
+        self.offset += struct.calcsize(fmt)
+        return values
+
+    def text(self) -> str:
+        """
+        Read a string written by _Writer.text()
+        """
+        length, = self.unpack('H')
+        value = bytes(self.data[self.offset:self.offset + length]).decode()
+        self.offset += length
+        return value
+
+    def codes(self) -> Tuple[int, ...]:
+        """
+        Read a list of Card codes written by _Writer.codes()
+        """
+        length, = self.unpack('I')
+        return self.unpack(f'{length}H')
+
+
+def dumps(board_obj: board.Board) -> bytes:
+    """
+    Serialize the state of a Board between two turns
+
+    The checkpoint holds a table of the distinct Cards, then the Players
+    (name, totals, Card codes and charged Cards held at the last
+    reshuffle) in seating order, the order of the Players still in the
+    game, the draw and discard piles, the charged Cards discarded face
+    down, the turn position and the state of the random generator.
+    Policies, listeners, custom actions and the GameContext configuration
+    are not saved: they belong to the Board the checkpoint is restored on.
+
+    :param board_obj: board.Board, the Board to save
+    :return: bytes, the checkpoint
+    """
+    deck_obj = board_obj.deck
+    codes: Dict[Tuple[int, str], int] = {}
+
+    def encode(items: Iterable[Optional[card.Card]]) -> List[int]:
+        result = []
+        for item in items:
+            if item is None:
+                result.append(_NO_CARD)
+                continue
+            key = (item.value, item.color)
+            if key not in codes:
+                codes[key] = len(codes)
+            result.append(codes[key])
+        return result
+
+    body = _Writer()
+    roster = board_obj.roster
+    seats = {id(player_obj): seat for seat, player_obj in enumerate(roster)}
+
+    body.pack('H', len(roster))
+    for player_obj in roster:
+        body.text(player_obj.name)
+        body.pack(
+            'iiiH', player_obj.life, player_obj.shield, player_obj.charge,
+            encode([player_obj.life_card])[0]
+        )
+        body.codes(encode(player_obj.shield_cards))
+        body.codes(encode(player_obj.charged_cards))
+        body.pack('I', board_obj.charged_before_reshuffle(player_obj))
+
+    body.pack('H', len(board_obj.players))
+    body.pack(
+        f'{len(board_obj.players)}H',
+        *(seats[id(player_obj)] for player_obj in board_obj.players)
+    )
+    body.codes(encode(deck_obj.cards))
+    body.codes(encode(deck_obj.discard_pile))
+
+    face_down = board_obj.face_down
+    body.pack('I', len(face_down))
+    body.pack(
+        f'{len(face_down)}H',
+        *(seats[id(player_obj)] for player_obj, _ in face_down)
+    )
+    body.codes(encode(item for _, item in face_down))
+
+    body.pack('II', board_obj.turn_index, board_obj.turn_count)
+
+    version, internal, gauss_next = board_obj.random.getstate()
+    body.pack(f'BI{len(internal)}I', version, len(internal), *internal)
+    body.pack('?d', gauss_next is not None, gauss_next or 0.0)
+
+    # the card table goes first so restore() can decode in one pass
+    header = _Writer()
+    header.pack('4sHH', _MAGIC, FORMAT_VERSION, cache.ENGINE_VERSION)
+    header.pack('H', len(codes))
+    for value, color in codes:
+        header.pack('i', value)
+        header.text(color)
+
+    return bytes(header.data + body.data)
+
+
+def restore(board_obj: board.Board, data: bytes) -> None:
+    """
+    Restore a checkpoint returned by dumps() on a Board
+
+    The Board must seat Players with the same names as the saved Board,
+    they are matched by name and reordered as saved.
+
+    :param board_obj: board.Board, the Board to restore, usually a new one
+        created with the same Players, Deck and GameContext configuration
+    :param data: bytes, the checkpoint
+    """
+    reader = _Reader(data)
+    magic, format_version, engine = reader.unpack('4sHH')
+    if magic != _MAGIC:
+        raise ValueError('Data is not a Board checkpoint, aborting...')
+    if (format_version, engine) != (FORMAT_VERSION, cache.ENGINE_VERSION):
+        raise ValueError(
+            f'Checkpoint format {format_version} engine {engine} is not '
+            f'supported, expected format {FORMAT_VERSION} '
+            f'engine {cache.ENGINE_VERSION}, aborting...'
+        )
+
+    n_cards, = reader.unpack('H')
+    table = []
+    for _ in range(n_cards):
+        value, = reader.unpack('i')
+        table.append(card.Card(value, reader.text()))
+
+    def decode(codes: Iterable[int]) -> List[Optional[card.Card]]:
+        return [None if code == _NO_CARD else table[code] for code in codes]
+
+    by_name = {player_obj.name: player_obj for player_obj in board_obj.roster}
+    if len(by_name) != len(board_obj.roster):
+        raise ValueError(
+            'Cannot restore a checkpoint on Players with the same name, '
+            'aborting...'
+        )
+
+    n_roster, = reader.unpack('H')
+    roster: List[player.Player] = []
+    stale_charges: List[int] = []
+    for _ in range(n_roster):
+        name = reader.text()
+        player_obj = by_name.pop(name, None)
+        if player_obj is None:
+            raise ValueError(
+                f'Player {name} of the checkpoint is not on the Board, '
+                f'aborting...'
+            )
+
+        life, shield, charge, life_code = reader.unpack('iiiH')
+        shield_cards = decode(reader.codes())
+        charged_cards = decode(reader.codes())
+        stale_charges.extend(reader.unpack('I'))
+        player_obj.set_state((
+            life, decode([life_code])[0], shield, shield_cards,
+            charge, charged_cards, len(charged_cards)
+        ))
+        roster.append(player_obj)
+
+    if by_name:
+        raise ValueError(
+            f'Players {sorted(by_name)} are not in the checkpoint, '
+            f'aborting...'
+        )
+
+    n_players, = reader.unpack('H')
+    players = [roster[seat] for seat in reader.unpack(f'{n_players}H')]
+    board_obj.deck.cards = decode(reader.codes())
+    board_obj.deck.discard_pile = decode(reader.codes())
+
+    n_face_down, = reader.unpack('I')
+    face_down_seats = reader.unpack(f'{n_face_down}H')
+    face_down = list(zip(
+        (roster[seat] for seat in face_down_seats), decode(reader.codes())
+    ))
+    turn_index, turn_count = reader.unpack('II')
+
+    version, length = reader.unpack('BI')
+    internal = reader.unpack(f'{length}I')
+    has_gauss, gauss_next = reader.unpack('?d')
+    board_obj.random.setstate(
+        (version, internal, gauss_next if has_gauss else None)
+    )
+
+    board_obj.set_position(
+        roster, players, turn_index, turn_count, face_down, stale_charges
+    )
+
+
+def save(board_obj: board.Board, path: str) -> None:
+    """
+    Write the checkpoint of a Board to a file, atomically
+
+    The checkpoint is written to a temporary file which replaces the file,
+    so a killed process leaves the previous checkpoint or the new one.
+
+    :param board_obj: board.Board, the Board to save
+    :param path: str, the checkpoint file
+    """
+    data = dumps(board_obj)
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp'
+    )
+    with os.fdopen(fd, 'wb') as checkpoint_file:
+        checkpoint_file.write(data)
+    os.replace(temp_path, path)
+
+
+def load(board_obj: board.Board, path: str) -> None:
+    """
+    Restore the checkpoint file of a Board, see restore()
+
+    :param board_obj: board.Board, the Board to restore
+    :param path: str, the checkpoint file
+    """
+    with open(path, 'rb') as checkpoint_file:
+        restore(board_obj, checkpoint_file.read())
+
+
+class Checkpointer(object):
+    __doc__ = """
+    Board listener saving a checkpoint every few turns.
+
+    A checkpoint is a few kilobytes, mostly the random generator state,
+    so saving every turn stays cheap.
+
+        board_obj.add_listener(Checkpointer('game.ckpt', every=100))
+    """
+
+    def __init__(self, path: str, every: int = 100) -> None:
+        """
+        Initialize a Checkpointer object
+
+        :param path: str, the checkpoint file
+        :param every: int, the number of turns between two checkpoints
+        """
+        self.path = path
+        self.every = every
+        self.saves = 0
+
+    def __call__(
+            self,
+            board_obj: board.Board,
+            event: str,
+            data: Dict[str, Any]
+    ) -> None:
+        """
+        Board listener, see board.Board.add_listener()
+        """
+        if event == 'turn' and board_obj.turn_count % self.every == 0:
+            save(board_obj, self.path)
+            self.saves += 1
+
+
+def _read_progress(path: str, key: bytes) -> Dict[int, runner.GameResult]:
+    """
+    The results of a progress file, created if needed
+
+    The file starts with the job key, a partly written last record is
+    truncated so new records can be appended.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) < len(key):
+        with open(path, 'wb') as progress_file:
+            progress_file.write(key)
+        return {}
+
+    with open(path, 'rb') as progress_file:
+        data = progress_file.read()
+
+    if data[:len(key)] != key:
+        raise ValueError(
+            f'Progress file {path} belongs to another job, aborting...'
+        )
+
+    end = len(key) + (len(data) - len(key)) // _RECORD.size * _RECORD.size
+    if end != len(data):
+        with open(path, 'r+b') as progress_file:
+            progress_file.truncate(end)
+
+    results = {}
+    for seed, winner, turns in _RECORD.iter_unpack(data[len(key):end]):
+        results[seed] = runner.GameResult(
+            seed, None if winner < 0 else winner, turns
+        )
+
+    return results
+
+
+def resume_games(
+        job: runner.GameJob,
+        seeds: Iterable[int],
+        directory: str,
+        every: int = 100,
+        max_workers: Optional[int] = None
+) -> List[runner.GameResult]:
+    """
+    Play the games of a GameJob, resuming an interrupted run
+
+    Finished games are appended to a progress file of the directory, and
+    games in progress are checkpointed every few turns. After a crash,
+    calling resume_games() again with the same arguments skips the
+    finished games and resumes the others from their last checkpoint,
+    with the same results as an uninterrupted run.
+
+    :param job: runner.GameJob, the games to play
+    :param seeds: Iterable[int], the seed of each game
+    :param directory: str, the directory of the progress and checkpoint
+        files, created if needed
+    :param every: int, the number of turns between two checkpoints
+    :param max_workers: Optional[int], the number of threads,
+        1 plays the games serially in the current thread
+    :return: List[runner.GameResult], the outcome of each game, in the
+        order of the seeds
+    """
+    seeds = list(seeds)
+    os.makedirs(directory, exist_ok=True)
+    key = bytes.fromhex(cache.job_key(job))
+
+    progress_path = os.path.join(directory, _PROGRESS)
+    done = _read_progress(progress_path, key)
+    lock = threading.Lock()
+
+    def play(seed: int) -> runner.GameResult:
+        checkpoint_path = os.path.join(directory, f'{seed}.ckpt')
+        game = job.make_board(seed, [Checkpointer(checkpoint_path, every)])
+        seats = {id(p): i for i, p in enumerate(game.roster)}
+        if os.path.exists(checkpoint_path):
+            load(game, checkpoint_path)
+
+        winner = game.play(max_turns=job.max_turns)
+        winner_seat = None if winner is None else seats[id(winner)]
+        result = runner.GameResult(seed, winner_seat, game.turn_count)
+
+        with lock, open(progress_path, 'ab') as progress_file:
+            progress_file.write(_RECORD.pack(
+                seed, -1 if winner_seat is None else winner_seat,
+                result.turns
+            ))
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        return result
+
+    missing = [seed for seed in dict.fromkeys(seeds) if seed not in done]
+    if max_workers == 1:
+        done.update((seed, play(seed)) for seed in missing)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            done.update(zip(missing, executor.map(play, missing)))
+
+    return [done[seed] for seed in seeds]
+
+
+if __name__ == '__main__':
+
+    from core import policy
+
+    demo_job = runner.GameJob([policy.RandomPolicy() for _ in range(4)])
+    demo_board = demo_job.make_board(seed=7)
+    for _ in range(25):
+        demo_board.take_turn()
+
+    checkpoint = dumps(demo_board)
+    expected = demo_board.play()
+
+    resumed_board = demo_job.make_board(seed=0)
+    restore(resumed_board, checkpoint)
+    print(
+        f'checkpoint of {len(checkpoint)} bytes at turn 25, '
+        f'same winner after resume: '
+        f'{resumed_board.play().name == expected.name}'
+    )
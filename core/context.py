@@ -0,0 +1,84 @@
+import random as rng
+from typing import Dict, Optional, Sequence
+
+from core import card
+
+# default player actions for the game
+DEFAULT_ACTIONS = ('Attack', 'Charge', 'Swap', 'Custom')
+
+
+class GameContext(object):
+    __doc__ = """
+    Per game configuration and random generator for the Shield game.
+
+    Every Board owns a GameContext instead of relying on process wide
+    state (the random module, Card class attributes, Board class actions),
+    so Boards can be played at the same time from several threads.
+    A seeded GameContext always plays the same game.
+    Game output and custom rules read Card settings through is_face() and
+    format_card(), the Card class attributes are only their defaults.
+    """
+
+    def __init__(
+            self,
+            seed: Optional[int] = None,
+            face_card: Optional[int] = None,
+            color_symbols: Optional[Dict[str, str]] = None,
+            actions: Sequence[str] = DEFAULT_ACTIONS,
+            shield_count: int = 2
+    ) -> None:
+        """
+        Initialize a GameContext object
+
+        :param seed: Optional[int], the seed of the random generator,
+            seeded from the operating system if None
+        :param face_card: Optional[int], the face card threshold,
+            default is card.Card.face_card
+        :param color_symbols: Optional[Dict[str, str]], the symbols of
+            the colors, default is card.Card.color_symbols
+        :param actions: Sequence[str], the names of the player actions
+        :param shield_count: int, the number of shield Cards of a Player,
+            at least 1 so the Swap action always has a Card to swap
+        """
+        if shield_count < 1:
+            raise ValueError(
+                f'shield_count must be at least 1, got {shield_count}, '
+                f'aborting...'
+            )
+
+        self.seed = seed
+        self.random = rng.Random(seed)
+
+        self.face_card = card.Card.face_card if face_card is None \
+            else face_card
+        self.color_symbols = dict(
+            card.Card.color_symbols if color_symbols is None
+            else color_symbols
+        )
+        self.actions = tuple(actions)
+        self.shield_count = shield_count
+
+    def is_face(self, item: card.Card) -> bool:
+        """
+        Whether a Card is a face card with this context's threshold
+
+        :param item: card.Card, the Card to check
+        :return: bool, is the Card a face card
+        """
+        return item.value >= self.face_card
+
+    def format_card(self, item: card.Card) -> str:
+        """
+        String representation of a Card with this context's symbols
+
+        :param item: card.Card, the Card to represent
+        :return: str, the value and color symbol of the Card
+        """
+        color = self.color_symbols.get(item.color, item.color)
+        return f'{item.value} {color}'
+
+    def __repr__(self) -> str:
+        """
+        Representation of the GameContext object
+        """
+        return f'{self.__class__.__name__}(seed={self.seed})'
@@ -1,9 +1,127 @@
+import array
 import random as rng
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from core import card
 
 
+class DeckSpec(object):
+    __doc__ = """
+    Simple description of a deck as a range of values and a list of colors.
+
+    Every (value, color) pair of the spec maps to an integer code:
+        code = color_index * len(value_range) + value_index
+    which matches the order of Deck.generate_deck().
+    The spec keeps a single shared Card per code, created on first access,
+    so multi deck shoes do not build one Card object per physical card.
+    """
+
+    def __init__(
+            self,
+            value_range: range | List[int],
+            color_list: List[str]
+    ) -> None:
+        """
+        Initialize a DeckSpec object with values and colors
+
+        :param value_range: range, the range of values for each color
+        :param color_list: list[str], the list of colors of the deck
+        """
+        self.__values = list(value_range)
+        self.__colors = list(color_list)
+
+        # (value, color) -> code, used to encode Cards
+        self.__codes = {
+            (value, color): i * len(self.__values) + j
+            for i, color in enumerate(self.__colors)
+            for j, value in enumerate(self.__values)
+        }
+        # code -> Card, filled lazily by to_card(), two threads creating
+        # the same Card at once only waste an equal Card object
+        self.__cards: List[Optional[card.Card]] = [None] * len(self)
+
+    @property
+    def values(self) -> List[int]:
+        """
+        The values of each color
+
+        :return: List[int], the list of values
+        """
+        return self.__values
+
+    @property
+    def colors(self) -> List[str]:
+        """
+        The colors of the deck
+
+        :return: List[str], the list of colors
+        """
+        return self.__colors
+
+    def to_card(self, code: int) -> card.Card:
+        """
+        The Card for a given code, created the first time it is asked for
+
+        :param code: int, the code of the Card
+        :return: card.Card, the shared Card for this code
+        """
+        if not 0 <= code < len(self.__cards):
+            raise ValueError(
+                f'Code {code} is not part of {self!r}, expected a code '
+                f'between 0 and {len(self.__cards) - 1}, aborting...'
+            )
+
+        item = self.__cards[code]
+        if item is None:
+            color, value = divmod(code, len(self.__values))
+            item = card.Card(self.__values[value], self.__colors[color])
+            self.__cards[code] = item
+
+        return item
+
+    def to_code(self, item: card.Card) -> int:
+        """
+        The code of a given Card
+
+        :param item: card.Card, a Card with a value and color of the spec
+        :return: int, the code of the Card
+        """
+        try:
+            return self.__codes[(item.value, item.color)]
+        except KeyError:
+            raise ValueError(
+                f'{item!r} is not part of {self!r}, aborting...'
+            ) from None
+
+    def __len__(self) -> int:
+        """
+        The number of distinct Cards in the spec
+
+        :return: int, the number of codes
+        """
+        return len(self.__values) * len(self.__colors)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Two specs are equal if they hold the same values and colors
+        """
+        if not isinstance(other, DeckSpec):
+            return NotImplemented
+        return (
+            self.__values == other.values and self.__colors == other.colors
+        )
+
+    def __hash__(self) -> int:
+        return hash((tuple(self.__values), tuple(self.__colors)))
+
+    def __repr__(self) -> str:
+        """
+        Representation of the DeckSpec object
+        """
+        values, colors = self.__values, self.__colors
+        return f'{self.__class__.__name__}({values}, {colors})'
+
+
 class Deck(object):
     __doc__ = """
     Simple deck of cards object implementation for the Shield game.
@@ -12,10 +130,25 @@ class Deck(object):
     It is initialize through class methods
         -> generate_default_deck(), for a classic 52 card deck
         -> generate_deck(value_range, color_list), for a custom deck
+        -> multi(n_decks, spec), for a shoe of several decks
+        -> from_array(codes, spec) / from_bytes(data, spec), from Card codes
     """
 
     __default_range = range(1, 14)
     __default_colors = ['spades', 'clubs', 'hearts', 'diamonds']
+    __default_spec = DeckSpec(__default_range, __default_colors)
+
+    # array typecode used to store Card codes
+    code_type = 'H'
+
+    @classmethod
+    def default_spec(cls) -> DeckSpec:
+        """
+        The DeckSpec of a standard 52 card deck
+
+        :return: DeckSpec, the shared default spec
+        """
+        return cls.__default_spec
 
     @classmethod
     def generate_default_deck(cls) -> 'Deck':
@@ -42,15 +175,79 @@ class Deck(object):
         :return: Deck, and instance of the object
         """
 
-        cards = [
-            card.Card(value, color)
-            for color in color_list
-            for value in value_range
-        ]
+        spec = DeckSpec(value_range, color_list)
+        return cls.from_array(range(len(spec)), spec)
 
-        return cls(cards)
+    @classmethod
+    def from_array(
+            cls,
+            codes: Iterable[int],
+            spec: Optional[DeckSpec] = None
+    ) -> 'Deck':
+        """
+        Generate a Deck object from Card codes
+
+        :param codes: Iterable[int], the codes of the Cards, top card first
+        :param spec: Optional[DeckSpec], the spec of the codes, default is
+            the standard 52 card deck
 
-    def __init__(self, cards: Optional[List[card.Card]] = None) -> None:
+        :return: Deck, and instance of the object
+        """
+        spec = spec or cls.default_spec()
+        cards = list(map(spec.to_card, codes))
+
+        return cls(cards, spec=spec)
+
+    @classmethod
+    def from_bytes(
+            cls,
+            data: bytes,
+            spec: Optional[DeckSpec] = None
+    ) -> 'Deck':
+        """
+        Generate a Deck object from Card codes packed as bytes
+
+        :param data: bytes, the codes as written by Deck.to_array().tobytes()
+        :param spec: Optional[DeckSpec], the spec of the codes
+
+        :return: Deck, and instance of the object
+        """
+        codes = array.array(cls.code_type)
+        codes.frombytes(data)
+
+        return cls.from_array(codes, spec)
+
+    @classmethod
+    def multi(
+            cls,
+            n_decks: int,
+            spec: Optional[DeckSpec] = None,
+            shuffled: bool = False,
+            random_state: Optional[rng.Random] = None
+    ) -> 'Deck':
+        """
+        Generate a shoe made of several identical decks
+
+        :param n_decks: int, the number of decks in the shoe
+        :param spec: Optional[DeckSpec], the spec of each deck
+        :param shuffled: bool, whether to shuffle the shoe before building it
+        :param random_state: Optional[rng.Random], the random generator used
+            to shuffle, the random module if None
+
+        :return: Deck, and instance of the object
+        """
+        spec = spec or cls.default_spec()
+        codes = list(range(len(spec))) * n_decks
+        if shuffled:
+            (random_state or rng).shuffle(codes)
+
+        return cls.from_array(codes, spec)
+
+    def __init__(
+            self,
+            cards: Optional[List[card.Card]] = None,
+            spec: Optional[DeckSpec] = None
+    ) -> None:
         """
         Initialize Deck object
 
@@ -58,6 +255,20 @@ class Deck(object):
         """
         self.__cards = cards or []
         self.__discard_pile = []
+        self.__spec = spec
+
+        # random generator used to shuffle, the random module by default,
+        # replaced by the generator of the GameContext when given to a Board
+        self.random = rng
+
+    @property
+    def spec(self) -> Optional[DeckSpec]:
+        """
+        The DeckSpec the Deck was generated from, if any
+
+        :return: Optional[DeckSpec], the spec of the Deck
+        """
+        return self.__spec
 
     @property
     def cards(self) -> List[card.Card]:
@@ -104,6 +315,17 @@ class Deck(object):
 
         self.__discard_pile = card_list
 
+    def to_array(self, spec: Optional[DeckSpec] = None) -> array.array:
+        """
+        The codes of the Cards in the card pile, top card first
+
+        :param spec: Optional[DeckSpec], the spec used to encode the Cards,
+            default is the spec of the Deck or the standard 52 card deck
+        :return: array.array, the Card codes
+        """
+        spec = spec or self.__spec or self.default_spec()
+        return array.array(self.code_type, map(spec.to_code, self.__cards))
+
     def discard(self, item: card.Card) -> None:
         """
         Add a given Card to the discard_pile
@@ -118,7 +340,7 @@ class Deck(object):
 
         :return: list[card.Card], the shuffled card pile
         """
-        rng.shuffle(self.__cards)
+        self.random.shuffle(self.__cards)
         return self.__cards
 
     def draw(self, cycle: bool = True) -> card.Card:
@@ -143,6 +365,18 @@ class Deck(object):
 
         return item
 
+    def undraw(self, item: card.Card) -> None:
+        """
+        Revert the last draw(), putting the Card back on top of the card_pile
+
+        :param item: card.Card, the last drawn Card
+        """
+        last = self.__discard_pile.pop()
+        assert last is item, (
+            f'Deck expected the last drawn Card {last!r}, \n\tGOT {item!r}'
+        )
+        self.__cards.insert(0, item)
+
     def put_top(self, item: card.Card) -> None:
         """
         Insert a card at index 0 of the card pile
@@ -206,7 +440,8 @@ class Deck(object):
         :param other: Deck, the second Deck to add
         :return: Deck, the resulting Deck object
         """
-        new_deck = Deck()
+        spec = self.spec if self.spec == other.spec else None
+        new_deck = Deck(spec=spec)
         new_deck.cards = self.cards + other.cards
         new_deck.discard_pile = self.discard_pile + other.discard_pile
 
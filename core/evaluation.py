@@ -0,0 +1,448 @@
+import collections
+import math
+import statistics
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core import deck
+from core import policy
+from core import runner
+
+
+class Standing(object):
+    __doc__ = """
+    Results of a Policy during an Evaluation.
+
+    Holds the number of games played and won, and an Elo scale rating
+    fitted on all the games so far, see fit_ratings().
+    """
+
+    # rating of a Policy of average strength
+    base_rating = 1500.0
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize a Standing object for a Policy name
+
+        :param name: str, the name of the Policy
+        """
+        self.name = name
+        self.games = 0
+        self.wins = 0
+        self.rating = self.base_rating
+
+    @property
+    def win_rate(self) -> float:
+        """
+        The fraction of games won
+
+        :return: float, the win rate, 0 if no game was played
+        """
+        return self.wins / self.games if self.games else 0.0
+
+    def interval(self, z: float) -> Tuple[float, float]:
+        """
+        The Wilson score interval of the win rate
+
+        :param z: float, the normal quantile of the confidence level
+        :return: Tuple[float, float], the lower and upper bounds
+        """
+        if not self.games:
+            return 0.0, 1.0
+
+        n, p = self.games, self.win_rate
+        center = (p + z * z / (2 * n)) / (1 + z * z / n)
+        half = (
+            z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+            / (1 + z * z / n)
+        )
+        return max(0.0, center - half), min(1.0, center + half)
+
+    def __repr__(self) -> str:
+        """
+        Representation of the Standing object
+        """
+        return (
+            f'{self.__class__.__name__}({self.name!r}, '
+            f'games={self.games}, wins={self.wins}, '
+            f'rating={self.rating:.1f})'
+        )
+
+
+def fit_ratings(
+        names: Iterable[str],
+        pair_wins: Dict[Tuple[str, str], int],
+        prior: float = 0.5,
+        tolerance: float = 1e-9,
+        max_iterations: int = 10_000
+) -> Dict[str, float]:
+    """
+    Fit Bradley-Terry ratings on the Elo scale from pairwise results
+
+    Maximum likelihood fit (minorization-maximization) over every game at
+    once, so the ratings do not depend on the order of the games. Each pair
+    of Policies gets prior virtual wins both ways, which keeps the rating of
+    a Policy without wins or losses finite. Ratings average base_rating.
+
+    :param names: Iterable[str], the rated Policy names
+    :param pair_wins: Dict[Tuple[str, str], int], the number of times the
+        first Policy beat the second one
+    :param prior: float, the virtual wins of each Policy over every other
+    :param tolerance: float, stops when no strength moves more than this
+    :param max_iterations: int, the maximum number of iterations
+    :return: Dict[str, float], the rating of each Policy
+    """
+    names = list(names)
+    wins = {
+        (winner, loser): pair_wins.get((winner, loser), 0) + prior
+        for winner in names for loser in names if winner != loser
+    }
+    total_wins = {
+        name: sum(wins[(name, other)] for other in names if other != name)
+        for name in names
+    }
+    strengths = {name: 1.0 for name in names}
+
+    for _ in range(max_iterations):
+        updated = {}
+        for name in names:
+            denominator = sum(
+                (wins[(name, other)] + wins[(other, name)])
+                / (strengths[name] + strengths[other])
+                for other in names if other != name
+            )
+            updated[name] = total_wins[name] / denominator
+
+        # strengths are only defined up to a factor, keep their mean log at 0
+        shift = math.exp(
+            -sum(map(math.log, updated.values())) / len(updated)
+        )
+        updated = {name: value * shift for name, value in updated.items()}
+        converged = all(
+            abs(updated[name] - strengths[name]) < tolerance
+            for name in names
+        )
+        strengths = updated
+        if converged:
+            break
+
+    return {
+        name: Standing.base_rating + 400 * math.log10(strength)
+        for name, strength in strengths.items()
+    }
+
+
+class Report(object):
+    __doc__ = """
+    Snapshot of an Evaluation, yielded while the games are played.
+    """
+
+    def __init__(
+            self,
+            games: int,
+            standings: List[Standing],
+            separated: bool,
+            z: float
+    ) -> None:
+        """
+        Initialize a Report object
+
+        :param games: int, the number of games played so far
+        :param standings: List[Standing], the standings sorted by win rate
+        :param separated: bool, whether the leader is separated from the rest
+        :param z: float, the normal quantile of the confidence level
+        """
+        self.games = games
+        self.standings = standings
+        self.separated = separated
+        self.z = z
+
+    @property
+    def leader(self) -> Standing:
+        """
+        The Standing with the highest win rate
+
+        :return: Standing, the current leader
+        """
+        return self.standings[0]
+
+    def __str__(self) -> str:
+        """
+        Representation of the Report
+        """
+        lines = [f'Report - games={self.games}, separated={self.separated}']
+        for standing in self.standings:
+            low, high = standing.interval(self.z)
+            lines.append(
+                f'\t{standing.name}: win rate {standing.win_rate:.3f} '
+                f'[{low:.3f}, {high:.3f}] - rating {standing.rating:.1f}'
+            )
+        return '\n'.join(lines)
+
+
+class Evaluation(object):
+    __doc__ = """
+    Evaluation harness comparing Policies by playing games on a Board.
+
+    Each Policy takes one seat. For every deck seed, the game is played once
+    per seat rotation with the same seed (common random numbers), so every
+    Policy plays the same deck order from every seat.
+    Every report_every games (after min_games), the Evaluation stops if the
+    confidence interval of the leader's win rate no longer overlaps the
+    others'. The intervals are Bonferroni corrected for the number of
+    checks and of compared Policies, so Policies of equal strength are
+    declared separated with a probability of at most 1 - confidence,
+    however many checks are made before max_games.
+    """
+
+    def __init__(
+            self,
+            policies: List[policy.Policy],
+            deck_factory: Callable[[], deck.Deck] = (
+                deck.Deck.generate_default_deck
+            ),
+            confidence: float = 0.95,
+            min_games: int = 100,
+            max_games: int = 100_000,
+            max_turns: int = 1_000,
+            first_seed: int = 0
+    ) -> None:
+        """
+        Initialize an Evaluation object given Policies
+
+        :param policies: List[policy.Policy], the Policies, names are unique
+        :param deck_factory: Callable[[], deck.Deck], creates a new Deck
+        :param confidence: float, the confidence level of the intervals
+        :param min_games: int, the number of games before stopping early
+        :param max_games: int, the maximum number of games of a matchup
+        :param max_turns: int, a game without winner after this many turns
+            counts as a game lost by everyone
+        :param first_seed: int, the deck seed of the first games
+        """
+        names = [policy_obj.name for policy_obj in policies]
+        if len(set(names)) != len(names):
+            raise ValueError(
+                f'Policy names must be unique, got {names}, aborting...'
+            )
+
+        self.__policies = dict(zip(names, policies))
+        self.__deck_factory = deck_factory
+        self.__confidence = confidence
+        self.__min_games = min_games
+        self.__max_games = max_games
+        self.__max_turns = max_turns
+        self.__first_seed = first_seed
+
+    @property
+    def policies(self) -> Dict[str, policy.Policy]:
+        """
+        The evaluated Policies by name
+
+        :return: Dict[str, policy.Policy], the Policies
+        """
+        return self.__policies
+
+    def play_game(self, seating: List[str], seed: int) -> Optional[int]:
+        """
+        Play a single game without output
+
+        :param seating: List[str], the Policy name of each seat
+        :param seed: int, the seed of the game
+        :return: Optional[int], the seat of the winner, None if no winner
+        """
+        job = runner.GameJob(
+            [self.__policies[name] for name in seating],
+            self.__deck_factory, self.__max_turns
+        )
+        return job.play(seed).winner
+
+    def iter_reports(
+            self,
+            matchup: List[str],
+            report_every: int = 100
+    ) -> Iterator[Report]:
+        """
+        Play the games of a matchup and yield Reports along the way
+
+        The stopping rule is only checked when a Report is made, the last
+        Report is yielded when the Evaluation stops, stop iterating to cut
+        the Evaluation short.
+
+        :param matchup: List[str], the Policy names, one seat each
+        :param report_every: int, the number of games between two Reports
+        :return: Iterator[Report], the Reports
+        """
+        z = self.corrected_z(len(matchup), report_every)
+        standings = {name: Standing(name) for name in matchup}
+        pair_wins: Dict[Tuple[str, str], int] = collections.Counter()
+        games, seed = 0, self.__first_seed
+        next_report = report_every
+
+        while games < self.__max_games:
+            for rotation in range(len(matchup)):
+                seating = matchup[rotation:] + matchup[:rotation]
+                winner_seat = self.play_game(seating, seed)
+                self.__update(standings, pair_wins, seating, winner_seat)
+                games += 1
+
+            seed += 1
+            if games < next_report:
+                continue
+
+            next_report += report_every
+            report = self.__report(games, standings, pair_wins, z)
+            if games >= self.__min_games and report.separated:
+                break
+            yield report
+
+        yield self.__report(games, standings, pair_wins, z)
+
+    def corrected_z(self, n_policies: int, report_every: int) -> float:
+        """
+        The normal quantile used by the stopping rule of a matchup
+
+        Bonferroni correction of the confidence level, split between every
+        check between min_games and max_games and every Policy compared to
+        the leader.
+
+        :param n_policies: int, the number of Policies of the matchup
+        :param report_every: int, the number of games between two checks
+        :return: float, the normal quantile of the intervals
+        """
+        n_checks = max(
+            (self.__max_games - self.__min_games) // report_every + 1, 1
+        )
+        n_comparisons = max(n_policies - 1, 1)
+        alpha = (1 - self.__confidence) / (n_checks * n_comparisons)
+
+        return statistics.NormalDist().inv_cdf(1 - alpha / 2)
+
+    def run(
+            self,
+            matchup: List[str],
+            report_every: int = 100,
+            reporter: Optional[Callable[[Report], None]] = print
+    ) -> Report:
+        """
+        Play the games of a matchup until the Evaluation stops
+
+        :param matchup: List[str], the Policy names, one seat each
+        :param report_every: int, the number of games between two Reports
+        :param reporter: Optional[Callable[[Report], None]], called with
+            every intermediate Report
+        :return: Report, the final Report
+        """
+        report = None
+        for report in self.iter_reports(matchup, report_every):
+            if reporter is not None:
+                reporter(report)
+
+        return report
+
+    def head_to_head(self, name1: str, name2: str, **kwargs) -> Report:
+        """
+        Evaluate two Policies against each other
+
+        :param name1: str, the name of the first Policy
+        :param name2: str, the name of the second Policy
+        :return: Report, the final Report
+        """
+        return self.run([name1, name2], **kwargs)
+
+    def free_for_all(self, **kwargs) -> Report:
+        """
+        Evaluate all the Policies in the same games
+
+        :return: Report, the final Report
+        """
+        return self.run(list(self.__policies), **kwargs)
+
+    def __update(
+            self,
+            standings: Dict[str, Standing],
+            pair_wins: Dict[Tuple[str, str], int],
+            seating: List[str],
+            winner_seat: Optional[int]
+    ) -> None:
+        """
+        Update the standings with the result of a game
+
+        The winner beats every other Policy of the game.
+
+        :param standings: Dict[str, Standing], the standings by Policy name
+        :param pair_wins: Dict[Tuple[str, str], int], the pairwise wins
+        :param seating: List[str], the Policy name of each seat
+        :param winner_seat: Optional[int], the seat of the winner
+        """
+        for name in seating:
+            standings[name].games += 1
+
+        if winner_seat is None:
+            return
+
+        winner = seating[winner_seat]
+        standings[winner].wins += 1
+        for name in seating:
+            if name != winner:
+                pair_wins[(winner, name)] += 1
+
+    def __report(
+            self,
+            games: int,
+            standings: Dict[str, Standing],
+            pair_wins: Dict[Tuple[str, str], int],
+            z: float
+    ) -> Report:
+        """
+        Build a Report from the current standings, fitting the ratings
+
+        :param games: int, the number of games played
+        :param standings: Dict[str, Standing], the standings by Policy name
+        :param pair_wins: Dict[Tuple[str, str], int], the pairwise wins
+        :param z: float, the corrected normal quantile, see corrected_z()
+        :return: Report, the current Report
+        """
+        for name, rating in fit_ratings(standings, pair_wins).items():
+            standings[name].rating = rating
+
+        ranked = sorted(
+            standings.values(), key=lambda s: s.win_rate, reverse=True
+        )
+        leader_low, _ = ranked[0].interval(z)
+        separated = all(
+            other.interval(z)[1] < leader_low for other in ranked[1:]
+        )
+
+        return Report(games, ranked, separated, z)
+
+
+if __name__ == '__main__':
+
+    import random
+
+    class AlwaysAttack(policy.RandomPolicy):
+        name = 'always-attack'
+
+        def choose_action(self, board_obj, player_obj):
+            return 0
+
+    evaluation = Evaluation([policy.RandomPolicy(), AlwaysAttack()])
+    evaluation.head_to_head('random', 'always-attack')
+
+    # the stopping rule must not separate Policies of equal strength more
+    # often than 1 - confidence, checked with coin flip games
+    class CoinFlip(Evaluation):
+
+        def play_game(self, seating, seed):
+            return coin.randrange(len(seating))
+
+    coin = random.Random(0)
+    n_runs = 200
+    false_stops = sum(
+        CoinFlip(
+            [policy.RandomPolicy(), AlwaysAttack()],
+            min_games=100, max_games=5_000
+        ).head_to_head('random', 'always-attack', reporter=None).separated
+        for _ in range(n_runs)
+    )
+    print(f'equal Policies separated in {false_stops / n_runs:.1%} of runs')
+    assert false_stops / n_runs <= 0.05, 'stopping rule is not corrected'
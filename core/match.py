@@ -0,0 +1,181 @@
+from typing import Callable, Dict, List, Optional
+
+from core import board
+from core import deck
+from core import player
+from core import policy
+from core.context import GameContext
+
+# signature of a rule: function(board), applied at the start of each round
+Rule = Callable[[board.Board], None]
+
+# signature of a rule picker: function(winner, match) -> new rule or None
+RulePicker = Callable[[player.Player, 'Match'], Optional[Rule]]
+
+
+class Match(object):
+    __doc__ = """
+    Simple multi round Match implementation for the Shield game.
+
+    A Match keeps the same Players, Deck and Board for every round,
+    they are reset between rounds instead of being created again.
+    After each round the winner can add a rule (see RulePicker),
+    every rule is applied to the Board at the start of the next rounds.
+    The Match keeps the number of rounds won by each Player.
+    """
+
+    def __init__(
+            self,
+            player_names: List[str],
+            custom_deck: Optional[deck.Deck] = None,
+            rule_picker: Optional[RulePicker] = None,
+            board_cls: type = board.Board,
+            policies: Optional[List[Optional[policy.Policy]]] = None,
+            default_policy: Optional[policy.Policy] = None,
+            verbose: bool = True,
+            seed: Optional[int] = None,
+            context: Optional[GameContext] = None
+    ) -> None:
+        """
+        Initialize a Match object given player names
+
+        :param player_names: List[str], the list of player names
+        :param custom_deck: Optional[deck.Deck], a Deck to play the Match
+        :param rule_picker: Optional[RulePicker], asks the winner of a round
+            for a new rule, no rules are added if None
+        :param board_cls: type, the Board class used to play the rounds
+        :param policies: Optional[List[Optional[policy.Policy]]], the Policy
+            of each Player, in the order of player_names, None entries use
+            the default policy
+        :param default_policy: Optional[policy.Policy], the Policy of
+            Players without one, asks for input() if None
+        :param verbose: bool, whether to print the game events, the Board
+            asks whether to show the Player infos every turn if True
+        :param seed: Optional[int], seeds the random generator of the
+            Match, ignored if a context is given
+        :param context: Optional[GameContext], the configuration and
+            random generator of the Match
+        """
+        policies = policies or [None] * len(player_names)
+        if len(policies) != len(player_names):
+            raise ValueError(
+                f'Expected {len(player_names)} policies, got '
+                f'{len(policies)}, aborting...'
+            )
+        players = [
+            player.Player(name, policy_obj)
+            for name, policy_obj in zip(player_names, policies)
+        ]
+
+        self.__board = board_cls(
+            players, custom_deck=custom_deck,
+            default_policy=default_policy,
+            verbose=verbose,
+            seed=seed,
+            context=context
+        )
+        self.__rule_picker = rule_picker
+        self.__rules: List[Rule] = []
+
+        self.__scores = {player_obj.name: 0 for player_obj in players}
+        self.__round_count = 0
+
+    @property
+    def board(self) -> board.Board:
+        """
+        The Board used for every round of the Match
+
+        :return: board.Board, the Board of the Match
+        """
+        return self.__board
+
+    @property
+    def players(self) -> List[player.Player]:
+        """
+        The list of all Players of the Match
+
+        :return: List[player.Player], the Players of the Match
+        """
+        return self.__board.roster
+
+    @property
+    def rules(self) -> List[Rule]:
+        """
+        The rules added by the winners of previous rounds
+
+        :return: List[Rule], the rules applied at the start of each round
+        """
+        return self.__rules
+
+    @property
+    def scores(self) -> Dict[str, int]:
+        """
+        The number of rounds won by each Player
+
+        :return: Dict[str, int], the rounds won by Player name
+        """
+        return self.__scores
+
+    @property
+    def round_count(self) -> int:
+        """
+        The number of rounds played so far
+
+        :return: int, the number of rounds played
+        """
+        return self.__round_count
+
+    def add_rule(self, rule: Rule) -> None:
+        """
+        Add a rule applied at the start of every following round
+
+        :param rule: Rule, a function taking the Board
+        """
+        self.__rules.append(rule)
+
+    def play_round(self) -> player.Player:
+        """
+        Reset the Board, apply the rules, deal the Cards and play a round
+
+        :return: player.Player, the winner of the round
+        """
+        self.__board.reset()
+        for rule in self.__rules:
+            rule(self.__board)
+        self.__board.deal()
+
+        winner = self.__board.play()
+
+        self.__round_count += 1
+        self.__scores[winner.name] += 1
+
+        if self.__rule_picker is not None:
+            new_rule = self.__rule_picker(winner, self)
+            if new_rule is not None:
+                self.add_rule(new_rule)
+
+        return winner
+
+    def play(self, n_rounds: int) -> Dict[str, int]:
+        """
+        Play a given number of rounds
+
+        :param n_rounds: int, the number of rounds to play
+        :return: Dict[str, int], the rounds won by Player name
+        """
+        for _ in range(n_rounds):
+            winner = self.play_round()
+            self.__board.log(
+                f'ROUND {self.__round_count} WON BY {winner.name.upper()}'
+                f' - SCORES: {self.__scores}'
+            )
+
+        return self.__scores
+
+
+if __name__ == '__main__':
+
+    new_player_names = ['lucas', 'julie', 'baptiste', 'alan']
+
+    match = Match(new_player_names)
+    match.play(3)
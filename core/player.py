@@ -1,7 +1,11 @@
-from typing import List
+from typing import Callable, List, Optional, Tuple, TYPE_CHECKING
 
 from core import card
 
+if TYPE_CHECKING:
+    from core.policy import Policy
+
+
 class Player:
     __doc__ = """
     Simple player object implementation for the Shield game.
@@ -10,14 +14,17 @@ class Player:
     shield total and shield cards as well as charged total and charged cards
     """
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, policy: Optional['Policy'] = None) -> None:
         """
         Initialize a Player object
 
         :param name: str, the name of the new player
+        :param policy: Optional[policy.Policy], takes the Player's decisions,
+            the Board's default policy is used if None
         """
 
         self.__name = name.capitalize()
+        self.policy = policy
 
         self.__life: int = 0
         self.__life_card: card.Card | None = None
@@ -152,13 +159,61 @@ class Player:
         self.__charged_cards = []
         self.__charge = 0
 
-    def show_info(self) -> List:
+    def get_state(self) -> Tuple:
+        """
+        The current Cards and totals of the Player, see set_state()
+
+        Card lists are not copied: shield Cards are replaced by a new list
+        when set, and only the number of charged Cards is needed since
+        charging appends to the current list.
+
+        :return: Tuple, the state of the Player
+        """
+        return (
+            self.__life, self.__life_card,
+            self.__shield, self.__shield_cards,
+            self.__charge, self.__charged_cards, len(self.__charged_cards)
+        )
+
+    def set_state(self, state: Tuple) -> None:
+        """
+        Restore a state returned by get_state()
+
+        :param state: Tuple, the state of the Player
+        """
+        (
+            self.__life, self.__life_card,
+            self.__shield, self.__shield_cards,
+            self.__charge, self.__charged_cards, n_charged
+        ) = state
+        del self.__charged_cards[n_charged:]
+
+    def reset(self) -> None:
+        """
+        Reset the Player's Cards and totals so it can play a new round
+        """
+        self.__life = 0
+        self.__life_card = None
+
+        self.__shield = 0
+        self.__shield_cards = []
+
+        self.reset_charges()
+
+    def show_info(
+            self,
+            format_card: Callable[[card.Card], str] = str
+    ) -> List:
         """
         Prints the Player's visible information
 
         Shows the name, life value, life card, shield value and shield cards
+        :param format_card: Callable[[card.Card], str], shows a Card, the
+            Board passes its GameContext.format_card()
         :return list, list holding the player's current information
         """
+        life_card = self.life_card and format_card(self.life_card)
+        shield_cards = [format_card(item) for item in self.shield_cards]
 
         player_data = [
             self.name,
@@ -167,9 +222,9 @@ class Player:
         ]
         print(
             f'Player Name : {self.name}'
-            f'\n\tLife : {self.life} - {self.life_card}'
+            f'\n\tLife : {self.life} - {life_card}'
             f'\n\tShield : [ {self.shield} ] -> '
-            f'{[str(shield_card) for shield_card in self.shield_cards]}'
+            f'{shield_cards}'
             f'\n\tCharged Attacks: {len(self.charged_cards)}'
             
             f'\n{"-" * 10}'
@@ -0,0 +1,395 @@
+from typing import TYPE_CHECKING
+
+from core import player
+
+if TYPE_CHECKING:
+    from core import board
+    from core import table
+
+
+class Policy(object):
+    __doc__ = """
+    Base policy object for the Shield game.
+
+    A Policy takes the decisions of a Player during its turn:
+        -> choose_action(), the action to perform (Board action index)
+        -> choose_player(), the Player to attack or to swap a shield Card of
+        -> choose_shield(), the index of the shield Card to swap
+        -> choose_custom_action(), the index of the custom action to perform
+    A Player without a Policy uses the default Policy of the Board.
+    """
+
+    # identifier of the policy, used to report and compare results
+    name = 'policy'
+    # bumped when the decisions change, invalidates cached results
+    version = 1
+
+    def choose_action(
+            self,
+            board_obj: 'board.Board',
+            player_obj: player.Player
+    ) -> int:
+        """
+        Choose the action for the Player's turn
+
+        :param board_obj: board.Board, the Board of the game
+        :param player_obj: player.Player, the Player taking its turn
+        :return: int, the index of the action in board_obj.actions
+        """
+        raise NotImplementedError
+
+    def choose_player(
+            self,
+            board_obj: 'board.Board',
+            player_obj: player.Player,
+            full: bool = False
+    ) -> player.Player:
+        """
+        Choose a Player from the Players still in the game
+
+        :param board_obj: board.Board, the Board of the game
+        :param player_obj: player.Player, the Player making the choice
+        :param full: bool, whether player_obj can choose itself
+        :return: player.Player, the chosen Player
+        """
+        raise NotImplementedError
+
+    def choose_shield(
+            self,
+            board_obj: 'board.Board',
+            player_obj: player.Player,
+            target: player.Player
+    ) -> int:
+        """
+        Choose which shield Card of the target to swap
+
+        :param board_obj: board.Board, the Board of the game
+        :param player_obj: player.Player, the swapping Player
+        :param target: player.Player, the Player whose shield is swapped
+        :return: int, the index of the shield Card to swap
+        """
+        raise NotImplementedError
+
+    def choose_custom_action(
+            self,
+            board_obj: 'board.Board',
+            player_obj: player.Player
+    ) -> int:
+        """
+        Choose which custom action to perform
+
+        :param board_obj: board.Board, the Board of the game
+        :param player_obj: player.Player, the Player taking its turn
+        :return: int, the index of the action in board_obj.custom_actions
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        """
+        Representation of the Policy object
+        """
+        return f'{self.__class__.__name__}()'
+
+
+class HumanPolicy(Policy):
+    __doc__ = """
+    Policy asking a human for every decision through input()
+    """
+
+    name = 'human'
+
+    def choose_action(self, board_obj, player_obj):
+        """
+        Ask the action number, see Policy.choose_action()
+        """
+        action_mssg = f'\n\t'.join(
+            f'-> {k}-{v}' for k, v in enumerate(board_obj.actions)
+        )
+
+        return int(input(
+            f'\n{player_obj.name} - '
+            f'Choose an action number :\n\t{action_mssg}\nChoice:'
+        ))
+
+    def choose_player(self, board_obj, player_obj, full=False):
+        """
+        Ask the Player number, see Policy.choose_player()
+        """
+        player_copy = board_obj.players.copy()
+
+        if not full:
+            player_copy.remove(player_obj)
+
+        player_mssg = '\n\t'.join(
+            f'-> {k}-{v.name}' for k, v in enumerate(player_copy)
+        )
+        player_choice = input(
+            f'Choose an opponent :\n\t{player_mssg}\nChoice:'
+        )
+        return player_copy[int(player_choice)]
+
+    def choose_shield(self, board_obj, player_obj, target):
+        """
+        Ask the shield Card number, see Policy.choose_shield()
+        """
+        swap_mssg = '\n\t'.join(
+            f'-> {k}-{board_obj.context.format_card(v)}'
+            for k, v in enumerate(target.shield_cards)
+        )
+
+        return int(input(
+            f'Choose a shield card to swap:\n\t{swap_mssg}\nChoice:'
+        ))
+
+    def choose_custom_action(self, board_obj, player_obj):
+        """
+        Ask the custom action number, see Policy.choose_custom_action()
+        """
+        custom_mssg = '\n\t'.join(
+            f'-> {k}-{name}'
+            for k, (name, _) in enumerate(board_obj.custom_actions)
+        )
+
+        return int(input(
+            f'Choose a custom action :\n\t{custom_mssg}\nChoice:'
+        ))
+
+
+class RandomPolicy(Policy):
+    __doc__ = """
+    Policy taking every decision at random with the Board's random generator
+    """
+
+    name = 'random'
+
+    def choose_action(self, board_obj, player_obj):
+        """
+        A random action, see Policy.choose_action()
+        """
+        # the 'Custom' action is only chosen if custom actions exist
+        n_actions = len(board_obj.actions) - 1
+        if board_obj.custom_actions:
+            n_actions += 1
+
+        return board_obj.random.randrange(n_actions)
+
+    def choose_player(self, board_obj, player_obj, full=False):
+        """
+        A random Player, see Policy.choose_player()
+        """
+        players = board_obj.players
+        if full:
+            return board_obj.random.choice(players)
+
+        # pick among the other Players without copying the list
+        index = board_obj.random.randrange(len(players) - 1)
+        if players[index] is player_obj:
+            index = len(players) - 1
+
+        return players[index]
+
+    def choose_shield(self, board_obj, player_obj, target):
+        """
+        A random shield Card, see Policy.choose_shield()
+        """
+        return board_obj.random.randrange(len(target.shield_cards))
+
+    def choose_custom_action(self, board_obj, player_obj):
+        """
+        A random custom action, see Policy.choose_custom_action()
+        """
+        return board_obj.random.randrange(len(board_obj.custom_actions))
+
+
+def _table_of(board_obj: 'board.Board') -> 'table.PlayerTable':
+    """
+    The PlayerTable of a Board, attached on first use
+
+    :param board_obj: board.Board, the Board of the game
+    :return: table.PlayerTable, the table indexing the Players
+    """
+    if board_obj.table is None:
+        # imported here, table depends on board which depends on policy
+        from core import table
+        table.PlayerTable.attach(board_obj)
+
+    return board_obj.table
+
+
+class HeuristicPolicy(Policy):
+    __doc__ = """
+    Base of the heuristic baseline Policies.
+
+    Heuristic Policies never scan the Players: they read the PlayerTable of
+    the Board (attached on first use), whose heaps give the weakest or most
+    shielded Player in O(log n), and only look at the few shield Cards of
+    one Player. They hold no state, so one instance can play every seat of
+    a GameJob from several threads.
+    By default they attack the weakest opponent and never use custom actions.
+    """
+
+    name = 'heuristic'
+
+    def choose_action(self, board_obj, player_obj):
+        """
+        Always attack, see Policy.choose_action()
+        """
+        return 0
+
+    def choose_player(self, board_obj, player_obj, full=False):
+        """
+        The weakest opponent to attack, or the swap target, see
+        Policy.choose_player()
+        """
+        # full is only asked for a swap, see choose_swap_target()
+        if full:
+            return self.choose_swap_target(board_obj, player_obj)
+        return _table_of(board_obj).weakest(exclude=player_obj)
+
+    def choose_swap_target(
+            self,
+            board_obj: 'board.Board',
+            player_obj: player.Player
+    ) -> player.Player:
+        """
+        Choose the Player whose shield Card is swapped
+
+        :param board_obj: board.Board, the Board of the game
+        :param player_obj: player.Player, the swapping Player
+        :return: player.Player, the Player to swap a shield Card of
+        """
+        return player_obj
+
+    def choose_shield(self, board_obj, player_obj, target):
+        """
+        Our lowest shield Card or an opponent's highest, see
+        Policy.choose_shield()
+        """
+        # lower our own shield Cards, raise nobody else's
+        values = [item.value for item in target.shield_cards]
+        if target is player_obj:
+            return values.index(min(values))
+        return values.index(max(values))
+
+    def choose_custom_action(self, board_obj, player_obj):
+        """
+        The first custom action, see Policy.choose_custom_action()
+        """
+        return 0
+
+
+class AttackWeakestPolicy(HeuristicPolicy):
+    __doc__ = """
+    Policy always attacking the opponent with the lowest life plus shield
+    """
+
+    name = 'attack-weakest'
+
+
+class ChargePolicy(HeuristicPolicy):
+    __doc__ = """
+    Policy charging until its charge reaches a threshold, then attacking
+    the weakest opponent
+    """
+
+    name = 'charge-until'
+
+    def __init__(self, threshold: int = 15) -> None:
+        """
+        Initialize a ChargePolicy object
+
+        :param threshold: int, the charge at which the Player attacks
+        """
+        self.threshold = threshold
+        self.name = f'{ChargePolicy.name}-{threshold}'
+
+    def choose_action(self, board_obj, player_obj):
+        """
+        Charge below the threshold, attack above, see Policy.choose_action()
+        """
+        return 0 if player_obj.charge >= self.threshold else 1
+
+    def __repr__(self) -> str:
+        """
+        Representation of the ChargePolicy object
+        """
+        return f'{self.__class__.__name__}({self.threshold})'
+
+
+class SwapShieldPolicy(HeuristicPolicy):
+    __doc__ = """
+    Policy swapping the best shield Card of the most shielded opponent
+    when it is higher than a threshold, attacking the weakest otherwise
+    """
+
+    name = 'swap-highest-shield'
+
+    def __init__(self, threshold: int = 7) -> None:
+        """
+        Initialize a SwapShieldPolicy object
+
+        :param threshold: int, the shield Card value above which it is
+            swapped, around the mean value of the Deck
+        """
+        self.threshold = threshold
+        self.name = f'{SwapShieldPolicy.name}-{threshold}'
+
+    def choose_action(self, board_obj, player_obj):
+        """
+        Swap if the best opponent shield Card is above the threshold, attack
+        otherwise, see Policy.choose_action()
+        """
+        target = self.choose_swap_target(board_obj, player_obj)
+        best = max(
+            (item.value for item in target.shield_cards), default=0
+        )
+        return 2 if best > self.threshold else 0
+
+    def choose_swap_target(self, board_obj, player_obj):
+        """
+        The opponent with the highest shield, see
+        HeuristicPolicy.choose_swap_target()
+        """
+        return _table_of(board_obj).highest_shield(exclude=player_obj)
+
+    def __repr__(self) -> str:
+        """
+        Representation of the SwapShieldPolicy object
+        """
+        return f'{self.__class__.__name__}({self.threshold})'
+
+
+class SelfSwapPolicy(HeuristicPolicy):
+    __doc__ = """
+    Policy swapping its own lowest shield Card when it is lower than a
+    threshold, attacking the weakest opponent otherwise
+    """
+
+    name = 'self-swap-lowest-shield'
+
+    def __init__(self, threshold: int = 7) -> None:
+        """
+        Initialize a SelfSwapPolicy object
+
+        :param threshold: int, the shield Card value below which it is
+            swapped, around the mean value of the Deck
+        """
+        self.threshold = threshold
+        self.name = f'{SelfSwapPolicy.name}-{threshold}'
+
+    def choose_action(self, board_obj, player_obj):
+        """
+        Swap if our lowest shield Card is below the threshold, attack
+        otherwise, see Policy.choose_action()
+        """
+        worst = min(
+            (item.value for item in player_obj.shield_cards),
+            default=self.threshold
+        )
+        return 2 if worst < self.threshold else 0
+
+    def __repr__(self) -> str:
+        """
+        Representation of the SelfSwapPolicy object
+        """
+        return f'{self.__class__.__name__}({self.threshold})'
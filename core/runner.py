@@ -0,0 +1,183 @@
+import concurrent.futures
+from typing import Callable, Iterable, List, Optional
+
+from core import board
+from core import deck
+from core import player
+from core import policy
+from core.context import GameContext
+
+
+class GameResult(object):
+    __doc__ = """
+    Outcome of a simulated game: seed, winner seat and number of turns.
+    """
+
+    __slots__ = ('seed', 'winner', 'turns')
+
+    def __init__(self, seed: int, winner: Optional[int], turns: int) -> None:
+        """
+        Initialize a GameResult object
+
+        :param seed: int, the seed of the game
+        :param winner: Optional[int], the seat of the winner, None if the
+            game was stopped without winner
+        :param turns: int, the number of turns played
+        """
+        self.seed = seed
+        self.winner = winner
+        self.turns = turns
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Two results are equal if all their fields are equal
+        """
+        if not isinstance(other, GameResult):
+            return NotImplemented
+        return (
+            (self.seed, self.winner, self.turns)
+            == (other.seed, other.winner, other.turns)
+        )
+
+    def __repr__(self) -> str:
+        """
+        Representation of the GameResult object
+        """
+        return (
+            f'{self.__class__.__name__}({self.seed}, '
+            f'{self.winner}, {self.turns})'
+        )
+
+
+class GameJob(object):
+    __doc__ = """
+    Description of games to simulate, played one seed at a time.
+
+    Each game gets its own Players, Deck, Board and seeded GameContext, so
+    a GameJob can be played from several threads at once, as long as its
+    Policies do not hold mutable state (the built-in ones do not).
+    """
+
+    def __init__(
+            self,
+            policies: List[policy.Policy],
+            deck_factory: Callable[[], deck.Deck] = (
+                deck.Deck.generate_default_deck
+            ),
+            max_turns: int = 1_000,
+            shield_count: int = 2
+    ) -> None:
+        """
+        Initialize a GameJob object
+
+        :param policies: List[policy.Policy], the Policy of each seat
+        :param deck_factory: Callable[[], deck.Deck], creates a new Deck,
+            only its Cards count, their order is ignored
+        :param max_turns: int, stops a game without winner after this many
+            turns
+        :param shield_count: int, the number of shield Cards of a Player
+        """
+        self.policies = policies
+        self.deck_factory = deck_factory
+        self.max_turns = max_turns
+        self.shield_count = shield_count
+
+    def make_board(
+            self,
+            seed: int,
+            listeners: Iterable[board.Listener] = ()
+    ) -> board.Board:
+        """
+        Create a quiet Board with new Players, ready to play
+
+        :param seed: int, the seed of the game
+        :param listeners: Iterable[board.Listener], added to the Board
+            before the Cards are dealt
+        :return: board.Board, the Board with Cards dealt
+        """
+        players = [
+            player.Player(f'{policy_obj.name}-{seat}', policy_obj)
+            for seat, policy_obj in enumerate(self.policies)
+        ]
+        # games only depend on the Deck composition and the seed, whatever
+        # the order of the Cards given by the factory, see cache.job_key()
+        deck_obj = self.deck_factory()
+        deck_obj.cards.sort(key=lambda item: (item.value, item.color))
+        game = board.Board(
+            players, custom_deck=deck_obj,
+            verbose=False,
+            context=GameContext(seed, shield_count=self.shield_count)
+        )
+        for listener in listeners:
+            game.add_listener(listener)
+        game.deal()
+
+        return game
+
+    def play(
+            self,
+            seed: int,
+            listeners: Iterable[board.Listener] = ()
+    ) -> GameResult:
+        """
+        Play a single game
+
+        :param seed: int, the seed of the game
+        :param listeners: Iterable[board.Listener], added to the Board
+        :return: GameResult, the outcome of the game
+        """
+        game = self.make_board(seed, listeners)
+        seats = {id(player_obj): i for i, player_obj in enumerate(game.roster)}
+        winner = game.play(max_turns=self.max_turns)
+
+        winner_seat = None if winner is None else seats[id(winner)]
+        return GameResult(seed, winner_seat, game.turn_count)
+
+
+def run_games(
+        job: GameJob,
+        seeds: Iterable[int],
+        max_workers: Optional[int] = None
+) -> List[GameResult]:
+    """
+    Play the games of a GameJob on a thread pool
+
+    Results are returned in the order of the seeds and are the same as
+    a serial run. Games scale with threads on free threaded Python builds,
+    with the GIL they run one at a time.
+
+    :param job: GameJob, the games to play
+    :param seeds: Iterable[int], the seed of each game
+    :param max_workers: Optional[int], the number of threads,
+        1 plays the games serially in the current thread
+    :return: List[GameResult], the outcome of each game
+    """
+    if max_workers == 1:
+        return [job.play(seed) for seed in seeds]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(job.play, seeds))
+
+
+if __name__ == '__main__':
+
+    import sys
+    import time
+
+    stress_job = GameJob([policy.RandomPolicy() for _ in range(6)])
+    stress_seeds = range(2_000)
+
+    serial = run_games(stress_job, stress_seeds, max_workers=1)
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'GIL enabled: {gil}')
+    for n_threads in (1, 2, 4, 8):
+        start = time.perf_counter()
+        results = run_games(stress_job, stress_seeds, max_workers=n_threads)
+        elapsed = time.perf_counter() - start
+
+        assert results == serial, 'threaded results differ from serial run'
+        print(
+            f'{n_threads} threads: {len(results) / elapsed:.0f} games/sec, '
+            f'same results as serial run'
+        )
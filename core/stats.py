@@ -0,0 +1,442 @@
+import collections
+import concurrent.futures
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+from core import board
+from core import player
+from core import runner
+
+
+class RunningStats(object):
+    __doc__ = """
+    Streaming count, mean, variance, min and max (Welford).
+
+    Two RunningStats merge exactly (Chan et al. parallel formula).
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty RunningStats object
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def variance(self) -> float:
+        """
+        The sample variance
+
+        :return: float, the variance, 0 with less than 2 values
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Add a value
+
+        :param value: float, the value to add
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: 'RunningStats') -> None:
+        """
+        Add all the values of another RunningStats
+
+        :param other: RunningStats, the stats to merge in this one
+        """
+        if not other.count:
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def report(self) -> Dict[str, float]:
+        """
+        The current statistics
+
+        :return: Dict[str, float], count, mean, std, min and max
+        """
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'std': math.sqrt(self.variance),
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+        }
+
+
+class QuantileSketch(object):
+    __doc__ = """
+    Mergeable quantile sketch with a relative accuracy guarantee (DDSketch).
+
+    Values are counted in logarithmic buckets, so any quantile is returned
+    within relative_accuracy of the true value, with a memory bounded by
+    max_buckets whatever the number of values. Sketches with the same
+    accuracy merge exactly by adding their bucket counts.
+    """
+
+    def __init__(
+            self,
+            relative_accuracy: float = 0.01,
+            max_buckets: int = 2048
+    ) -> None:
+        """
+        Initialize an empty QuantileSketch object
+
+        :param relative_accuracy: float, the relative error of quantiles
+        :param max_buckets: int, the maximum number of buckets per sign,
+            the lowest buckets are collapsed beyond it
+        """
+        self.relative_accuracy = relative_accuracy
+        self.__gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.__log_gamma = math.log(self.__gamma)
+        self.__max_buckets = max_buckets
+
+        self.count = 0
+        self.__zero = 0
+        self.__positive: Dict[int, int] = collections.Counter()
+        self.__negative: Dict[int, int] = collections.Counter()
+
+    def add(self, value: float) -> None:
+        """
+        Add a value
+
+        :param value: float, the value to add
+        """
+        self.count += 1
+        if value > 0:
+            self.__positive[self.__key(value)] += 1
+            self.__collapse(self.__positive)
+        elif value < 0:
+            self.__negative[self.__key(-value)] += 1
+            self.__collapse(self.__negative)
+        else:
+            self.__zero += 1
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Add all the values of another QuantileSketch
+
+        :param other: QuantileSketch, a sketch with the same accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f'Cannot merge sketches of accuracy '
+                f'{other.relative_accuracy} and {self.relative_accuracy}, '
+                f'aborting...'
+            )
+
+        self.count += other.count
+        self.__zero += other.__zero
+        self.__positive.update(other.__positive)
+        self.__negative.update(other.__negative)
+        self.__collapse(self.__positive)
+        self.__collapse(self.__negative)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        The estimated q quantile of the values
+
+        :param q: float, the quantile, between 0 and 1
+        :return: Optional[float], the quantile, None if empty
+        """
+        if not self.count:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.__negative, reverse=True):
+            seen += self.__negative[key]
+            if seen > rank:
+                return -self.__value(key)
+
+        seen += self.__zero
+        if seen > rank:
+            return 0.0
+
+        for key in sorted(self.__positive):
+            seen += self.__positive[key]
+            if seen > rank:
+                return self.__value(key)
+
+        return self.__value(max(self.__positive))
+
+    def report(self) -> Dict[str, Optional[float]]:
+        """
+        The usual quantiles of the values
+
+        :return: Dict[str, Optional[float]], the p50, p90, p99 quantiles
+        """
+        return {
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+        }
+
+    def __key(self, value: float) -> int:
+        """
+        The bucket of a positive value
+        """
+        return math.ceil(math.log(value) / self.__log_gamma)
+
+    def __value(self, key: int) -> float:
+        """
+        The representative value of a bucket
+        """
+        return 2 * self.__gamma ** key / (self.__gamma + 1)
+
+    def __collapse(self, buckets: Dict[int, int]) -> None:
+        """
+        Merge the lowest buckets together until max_buckets remain
+        """
+        while len(buckets) > self.__max_buckets:
+            lowest, second = sorted(buckets)[:2]
+            buckets[second] += buckets.pop(lowest)
+
+
+class Summary(object):
+    __doc__ = """
+    RunningStats and QuantileSketch of the same values.
+    """
+
+    __slots__ = ('stats', 'sketch')
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty Summary object
+        """
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch()
+
+    def add(self, value: float) -> None:
+        """
+        Add a value
+
+        :param value: float, the value to add
+        """
+        self.stats.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other: 'Summary') -> None:
+        """
+        Add all the values of another Summary
+
+        :param other: Summary, the summary to merge in this one
+        """
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        The statistics and quantiles of the values
+
+        :return: Dict[str, Any], count, mean, std, min, max and quantiles
+        """
+        return {**self.stats.report(), **self.sketch.report()}
+
+
+class GameStats(object):
+    __doc__ = """
+    Streaming statistics of many games, fed by Board events.
+
+    Keeps summaries of the game length, the turn of the first elimination,
+    attack values and overkill damage (life pushed below 0 by an attack
+    eliminating its target, 0 when life falls exactly to 0), the count of
+    each action, a histogram per action and the wins by seat.
+    Histograms count the attack values, the charge totals after a charge,
+    the target's shield after a swap and the names of custom actions.
+    The memory does not grow with the number of games, and the GameStats
+    of several workers merge exactly into one with merge().
+
+        game_stats = GameStats()
+        job.play(seed, listeners=[game_stats])
+        game_stats.report()
+    """
+
+    # summaries kept by a GameStats
+    summaries = ('game_length', 'first_elimination', 'attack', 'overkill')
+    # actions counted and histogrammed by a GameStats
+    action_names = ('attack', 'charge', 'swap', 'custom')
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty GameStats object
+        """
+        self.games = 0
+        self.unfinished = 0
+        self.game_length = Summary()
+        self.first_elimination = Summary()
+        self.attack = Summary()
+        self.overkill = Summary()
+        self.histograms: Dict[str, Dict[Any, int]] = {
+            action: collections.Counter() for action in self.action_names
+        }
+        self.actions: Dict[str, int] = collections.Counter()
+        self.seat_wins: Dict[int, int] = collections.Counter()
+
+        # state of the game being played
+        self.__seats: Dict[int, int] = {}
+        self.__first_elimination: Optional[int] = None
+
+    def __call__(
+            self,
+            board_obj: board.Board,
+            event: str,
+            data: Dict[str, Any]
+    ) -> None:
+        """
+        Board listener, see board.Board.add_listener()
+        """
+        if event in self.action_names:
+            self.actions[event] += 1
+
+        if event == 'attack':
+            self.attack.add(data['value'])
+            self.histograms['attack'][data['value']] += 1
+            life = data['target'].life
+            if data['hit_life'] and life <= 0:
+                self.overkill.add(max(-life, 0))
+
+        elif event == 'charge':
+            self.histograms['charge'][data['player'].charge] += 1
+
+        elif event == 'swap':
+            self.histograms['swap'][data['target'].shield] += 1
+
+        elif event == 'custom':
+            self.histograms['custom'][data['name']] += 1
+
+        elif event == 'elimination':
+            if self.__first_elimination is None:
+                # the turn in progress is not counted yet
+                self.__first_elimination = board_obj.turn_count + 1
+
+        elif event in ('deal', 'restore'):
+            self.__seats = {
+                id(player_obj): seat
+                for seat, player_obj in enumerate(board_obj.roster)
+            }
+            if event == 'deal':
+                self.__first_elimination = None
+
+        elif event == 'end':
+            self.__end_game(board_obj, data['winner'])
+
+    def __end_game(
+            self,
+            board_obj: board.Board,
+            winner: Optional[player.Player]
+    ) -> None:
+        """
+        Add the results of the game that just ended
+        """
+        self.games += 1
+        self.game_length.add(board_obj.turn_count)
+        if self.__first_elimination is not None:
+            self.first_elimination.add(self.__first_elimination)
+
+        if winner is None:
+            self.unfinished += 1
+        else:
+            self.seat_wins[self.__seats[id(winner)]] += 1
+
+    def merge(self, other: 'GameStats') -> None:
+        """
+        Add all the games of another GameStats
+
+        :param other: GameStats, the stats to merge in this one
+        """
+        self.games += other.games
+        self.unfinished += other.unfinished
+        for name in self.summaries:
+            getattr(self, name).merge(getattr(other, name))
+        for action, histogram in self.histograms.items():
+            histogram.update(other.histograms[action])
+        self.actions.update(other.actions)
+        self.seat_wins.update(other.seat_wins)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        The statistics of all the games
+
+        :return: Dict[str, Any], the statistics by name
+        """
+        finished = self.games - self.unfinished
+        report = {
+            'games': self.games,
+            'unfinished': self.unfinished,
+            'actions': dict(self.actions),
+            'histograms': {
+                action: dict(sorted(histogram.items()))
+                for action, histogram in self.histograms.items()
+            },
+            'seat_win_rate': {
+                seat: wins / finished
+                for seat, wins in sorted(self.seat_wins.items())
+            },
+        }
+        for name in self.summaries:
+            report[name] = getattr(self, name).report()
+
+        return report
+
+
+def collect(
+        job: runner.GameJob,
+        seeds: Iterable[int],
+        max_workers: int = 4
+) -> GameStats:
+    """
+    Play the games of a GameJob and return the merged GameStats
+
+    Seeds are split in one chunk per worker, each worker feeds its own
+    GameStats and the partial GameStats are merged at the end.
+
+    :param job: runner.GameJob, the games to play
+    :param seeds: Iterable[int], the seed of each game
+    :param max_workers: int, the number of threads
+    :return: GameStats, the statistics of all the games
+    """
+    seeds = list(seeds)
+    chunks: List[List[int]] = [
+        seeds[i::max_workers] for i in range(max_workers)
+    ]
+
+    def play_chunk(chunk: List[int]) -> GameStats:
+        game_stats = GameStats()
+        for seed in chunk:
+            job.play(seed, listeners=[game_stats])
+        return game_stats
+
+    total = GameStats()
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        for partial in executor.map(play_chunk, chunks):
+            total.merge(partial)
+
+    return total
+
+
+if __name__ == '__main__':
+
+    import pprint
+
+    from core import policy
+
+    stats_job = runner.GameJob([policy.RandomPolicy() for _ in range(4)])
+    pprint.pprint(collect(stats_job, range(2_000)).report())
@@ -0,0 +1,318 @@
+import functools
+import itertools
+import math
+from typing import Callable, Dict, Iterable, List, Optional
+
+from core import deck
+from core import policy
+from core import runner
+
+# signature of a backend: function(job, seeds) -> results in seed order
+Backend = Callable[[runner.GameJob, List[int]], List[runner.GameResult]]
+
+# colors used by the sweep, the standard ones first
+_COLORS = [
+    'spades', 'clubs', 'hearts', 'diamonds',
+    'rock', 'paper', 'scissors', 'lizard', 'spock'
+]
+
+
+class SweepPoint(object):
+    __doc__ = """
+    A configuration of a Sweep and the running statistics of its games.
+
+    Keeps the game length mean and variance (Welford) and the number of
+    wins of each seat, so a point never stores individual results.
+    """
+
+    def __init__(
+            self,
+            value_range: range,
+            n_colors: int,
+            n_players: int,
+            shield_count: int
+    ) -> None:
+        """
+        Initialize a SweepPoint object
+
+        :param value_range: range, the values of each color of the Deck
+        :param n_colors: int, the number of colors of the Deck
+        :param n_players: int, the number of Players
+        :param shield_count: int, the number of shield Cards of a Player
+        """
+        self.value_range = value_range
+        self.n_colors = n_colors
+        self.n_players = n_players
+        self.shield_count = shield_count
+
+        self.games = 0
+        self.finished = 0
+        self.mean_turns = 0.0
+        self.__m2_turns = 0.0
+        self.seat_wins = [0] * n_players
+
+    @property
+    def params(self) -> Dict[str, object]:
+        """
+        The parameters of the point
+
+        :return: Dict[str, object], the parameters by name
+        """
+        return {
+            'value_range': self.value_range,
+            'n_colors': self.n_colors,
+            'n_players': self.n_players,
+            'shield_count': self.shield_count,
+        }
+
+    @property
+    def var_turns(self) -> float:
+        """
+        The sample variance of the game length
+
+        :return: float, the variance, infinite with less than 2 games
+        """
+        if self.games < 2:
+            return math.inf
+        return self.__m2_turns / (self.games - 1)
+
+    @property
+    def seat_advantage(self) -> float:
+        """
+        The win rate of the first seat minus the fair win rate
+
+        :return: float, positive if the first Player is favored
+        """
+        if not self.finished:
+            return 0.0
+        return self.seat_wins[0] / self.finished - 1 / self.n_players
+
+    @property
+    def uncertainty(self) -> float:
+        """
+        The squared standard error of the estimates of the point
+
+        Sum of the relative error of the mean game length and the error of
+        the first seat win rate, the Sweep plays more games where it is high.
+
+        :return: float, the uncertainty of the point
+        """
+        if self.games < 2 or not self.finished:
+            return math.inf
+
+        p = self.seat_wins[0] / self.finished
+        turns_error = (
+            self.var_turns / self.games / max(self.mean_turns, 1) ** 2
+        )
+        seat_error = max(p * (1 - p), 1 / self.finished) / self.finished
+
+        return turns_error + seat_error
+
+    def job(
+            self,
+            policy_factory: Callable[[], policy.Policy],
+            max_turns: int
+    ) -> runner.GameJob:
+        """
+        The GameJob playing this point's configuration
+
+        :param policy_factory: Callable[[], policy.Policy], the seat Policy
+        :param max_turns: int, stops a game without winner after this many
+        :return: runner.GameJob, the job of the point
+        """
+        deck_factory = functools.partial(
+            deck.Deck.generate_deck,
+            self.value_range, _COLORS[:self.n_colors]
+        )
+        return runner.GameJob(
+            [policy_factory() for _ in range(self.n_players)],
+            deck_factory, max_turns, self.shield_count
+        )
+
+    def add(self, result: runner.GameResult) -> None:
+        """
+        Add the outcome of a game to the statistics
+
+        :param result: runner.GameResult, the outcome of a game
+        """
+        self.games += 1
+        delta = result.turns - self.mean_turns
+        self.mean_turns += delta / self.games
+        self.__m2_turns += delta * (result.turns - self.mean_turns)
+
+        if result.winner is not None:
+            self.finished += 1
+            self.seat_wins[result.winner] += 1
+
+    def __repr__(self) -> str:
+        """
+        Representation of the SweepPoint object
+        """
+        return (
+            f'{self.__class__.__name__}({self.value_range}, {self.n_colors}, '
+            f'{self.n_players}, {self.shield_count})'
+        )
+
+
+class Sweep(object):
+    __doc__ = """
+    Parameter sweep over Deck values, colors, Players and shield Cards.
+
+    Every point of the grid first plays initial_games games, then each
+    round plays a batch of games on the points with the highest
+    uncertainty (see SweepPoint.uncertainty), so games go where the
+    outcome varies most instead of being spread evenly.
+    Games of a batch are played through a backend, run_games() on a thread
+    pool by default.
+
+        sweep = Sweep([range(1, 14), range(1, 30)], [4, 5], [2, 4], [1, 2])
+        sweep.run(total_games=20_000)
+        surface = sweep.response_surface()
+    """
+
+    def __init__(
+            self,
+            value_ranges: Iterable[range],
+            color_counts: Iterable[int],
+            player_counts: Iterable[int],
+            shield_counts: Iterable[int] = (2,),
+            policy_factory: Callable[[], policy.Policy] = policy.RandomPolicy,
+            initial_games: int = 20,
+            batch_size: int = 50,
+            points_per_round: int = 4,
+            max_turns: int = 1_000,
+            backend: Optional[Backend] = None,
+            first_seed: int = 0
+    ) -> None:
+        """
+        Initialize a Sweep object over the grid of the given parameters
+
+        :param value_ranges: Iterable[range], the Deck value ranges
+        :param color_counts: Iterable[int], the Deck color counts
+        :param player_counts: Iterable[int], the Player counts
+        :param shield_counts: Iterable[int], the shield Card counts
+        :param policy_factory: Callable[[], policy.Policy], creates the
+            Policy of each seat
+        :param initial_games: int, the games played on every point first
+        :param batch_size: int, the games played on a point per round
+        :param points_per_round: int, the points played each round
+        :param max_turns: int, stops a game without winner after this many
+        :param backend: Optional[Backend], plays the games of a job,
+            runner.run_games() if None
+        :param first_seed: int, the seed of the first game
+        """
+        self.__points = [
+            SweepPoint(value_range, n_colors, n_players, shield_count)
+            for value_range, n_colors, n_players, shield_count
+            in itertools.product(
+                value_ranges, color_counts, player_counts, shield_counts
+            )
+        ]
+        if any(p.n_colors > len(_COLORS) for p in self.__points):
+            raise ValueError(
+                f'Sweep supports up to {len(_COLORS)} colors, aborting...'
+            )
+        if any(p.shield_count < 1 for p in self.__points):
+            raise ValueError(
+                'Sweep shield counts must be at least 1, aborting...'
+            )
+
+        self.__policy_factory = policy_factory
+        self.__initial_games = initial_games
+        self.__batch_size = batch_size
+        self.__points_per_round = points_per_round
+        self.__max_turns = max_turns
+        self.__backend = backend or runner.run_games
+        self.__next_seed = first_seed
+
+    @property
+    def points(self) -> List[SweepPoint]:
+        """
+        The points of the grid
+
+        :return: List[SweepPoint], the points
+        """
+        return self.__points
+
+    @property
+    def games(self) -> int:
+        """
+        The number of games played on all points
+
+        :return: int, the number of games played
+        """
+        return sum(point.games for point in self.__points)
+
+    def play(self, point: SweepPoint, n_games: int) -> None:
+        """
+        Play games on a point with new seeds
+
+        :param point: SweepPoint, the point to play
+        :param n_games: int, the number of games to play
+        """
+        seeds = list(range(self.__next_seed, self.__next_seed + n_games))
+        self.__next_seed += n_games
+
+        job = point.job(self.__policy_factory, self.__max_turns)
+        for result in self.__backend(job, seeds):
+            point.add(result)
+
+    def run(self, total_games: int) -> List[Dict[str, object]]:
+        """
+        Play games until total_games games are played on the whole grid
+
+        :param total_games: int, the game budget of the Sweep
+        :return: List[Dict[str, object]], the response surface
+        """
+        for point in self.__points:
+            if point.games < self.__initial_games:
+                self.play(point, self.__initial_games - point.games)
+
+        while self.games < total_games:
+            ranked = sorted(
+                self.__points, key=lambda p: p.uncertainty, reverse=True
+            )
+            for point in ranked[:self.__points_per_round]:
+                n_games = min(self.__batch_size, total_games - self.games)
+                if n_games <= 0:
+                    break
+                self.play(point, n_games)
+
+        return self.response_surface()
+
+    def response_surface(self) -> List[Dict[str, object]]:
+        """
+        The estimated game length and seat advantage of every point
+
+        :return: List[Dict[str, object]], one row per point with the
+            parameters, games, mean_turns, turns_error and seat_advantage
+        """
+        surface = []
+        for point in self.__points:
+            row = point.params
+            row.update(
+                games=point.games,
+                mean_turns=point.mean_turns,
+                turns_error=math.sqrt(point.var_turns / max(point.games, 1)),
+                seat_advantage=point.seat_advantage,
+            )
+            surface.append(row)
+
+        return surface
+
+
+if __name__ == '__main__':
+
+    sweep = Sweep(
+        [range(1, 14), range(1, 30)], [4, 5], [2, 4, 8], [1, 2, 3]
+    )
+    for sweep_row in sweep.run(total_games=10_000):
+        print(
+            f"{sweep_row['value_range']} colors={sweep_row['n_colors']} "
+            f"players={sweep_row['n_players']} "
+            f"shields={sweep_row['shield_count']}: "
+            f"games={sweep_row['games']} "
+            f"turns={sweep_row['mean_turns']:.1f}"
+            f"±{sweep_row['turns_error']:.1f} "
+            f"seat advantage={sweep_row['seat_advantage']:+.3f}"
+        )
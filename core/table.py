@@ -0,0 +1,340 @@
+import array
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+from core import board
+from core import player
+
+# heap entry: (sorting key, seat, version of the seat when pushed)
+_Entry = Tuple[int, int, int]
+
+
+class PlayerTable(object):
+    __doc__ = """
+    Struct of arrays view of the Players of a Board, for large tables.
+
+    Life, shield and charge totals are stored in arrays indexed by seat
+    (the index of the Player in Board.roster when Cards are dealt), and
+    heaps index the seats by effective life (life + shield), shield and
+    charge. Heaps are updated incrementally from the Board events:
+    changed seats get a new version and a new heap entry, outdated entries
+    are skipped when they reach the top of a heap.
+
+        table = PlayerTable.attach(board_obj)
+        target = table.weakest(exclude=board_obj.current_player)
+    """
+
+    @classmethod
+    def attach(cls, board_obj: board.Board) -> 'PlayerTable':
+        """
+        Create a PlayerTable listening to a Board, as board_obj.table
+
+        :param board_obj: board.Board, the Board to index
+        :return: PlayerTable, the new PlayerTable
+        """
+        table = cls()
+        board_obj.table = table
+        board_obj.add_listener(table)
+
+        if board_obj.players and board_obj.players[0].life_card is not None:
+            table.build(board_obj)
+
+        return table
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty PlayerTable object, see build()
+        """
+        self.__players: List[player.Player] = []
+        self.__seats: Dict[int, int] = {}
+
+        self.__life = array.array('i')
+        self.__shield = array.array('i')
+        self.__charge = array.array('i')
+        self.__alive = bytearray()
+        self.__versions = array.array('L')
+        self.__n_alive = 0
+
+        self.__min_hp: List[_Entry] = []
+        self.__max_hp: List[_Entry] = []
+        self.__max_shield: List[_Entry] = []
+        self.__max_charge: List[_Entry] = []
+
+    def build(self, board_obj: board.Board) -> None:
+        """
+        Index all the Players of a Board
+
+        :param board_obj: board.Board, the Board to index
+        """
+        roster = board_obj.roster
+        n_seats = len(roster)
+        alive = {id(player_obj) for player_obj in board_obj.players}
+
+        self.__players = list(roster)
+        self.__seats = {
+            id(player_obj): i for i, player_obj in enumerate(roster)
+        }
+
+        self.__life = array.array('i', (p.life for p in roster))
+        self.__shield = array.array('i', (p.shield for p in roster))
+        self.__charge = array.array('i', (p.charge for p in roster))
+        self.__alive = bytearray(id(p) in alive for p in roster)
+        self.__versions = array.array('L', [0]) * n_seats
+        self.__n_alive = len(alive)
+
+        self.__rebuild_heaps()
+
+    @property
+    def players(self) -> List[player.Player]:
+        """
+        The Players of the table, indexed by seat
+
+        :return: List[player.Player], the Players by seat
+        """
+        return self.__players
+
+    def seat_of(self, player_obj: player.Player) -> int:
+        """
+        The seat of a given Player
+
+        :param player_obj: player.Player, a Player of the table
+        :return: int, the seat of the Player
+        """
+        return self.__seats[id(player_obj)]
+
+    def effective_life(self, seat: int) -> int:
+        """
+        The life plus shield of a seat
+
+        :param seat: int, the seat
+        :return: int, the effective life
+        """
+        return self.__life[seat] + self.__shield[seat]
+
+    def update(self, player_obj: player.Player) -> None:
+        """
+        Update the totals of a Player, in O(log n)
+
+        :param player_obj: player.Player, the Player whose totals changed
+        """
+        seat = self.__seats[id(player_obj)]
+        if not self.__alive[seat]:
+            return
+
+        life, shield = player_obj.life, player_obj.shield
+        charge = player_obj.charge
+        hp_changed = (
+            life != self.__life[seat] or shield != self.__shield[seat]
+        )
+        charge_changed = charge != self.__charge[seat]
+        if not (hp_changed or charge_changed):
+            return
+
+        self.__life[seat], self.__shield[seat] = life, shield
+        self.__charge[seat] = charge
+        self.__versions[seat] += 1
+        self.__push(seat)
+
+    def eliminate(self, player_obj: player.Player) -> None:
+        """
+        Remove a Player from the indexes
+
+        :param player_obj: player.Player, the eliminated Player
+        """
+        seat = self.__seats[id(player_obj)]
+        if self.__alive[seat]:
+            self.__alive[seat] = 0
+            self.__n_alive -= 1
+
+    def revive(self, player_obj: player.Player) -> None:
+        """
+        Put back an eliminated Player in the indexes, after Board.undo()
+
+        :param player_obj: player.Player, the Player back in the game
+        """
+        seat = self.__seats[id(player_obj)]
+        if not self.__alive[seat]:
+            self.__alive[seat] = 1
+            self.__n_alive += 1
+            self.__versions[seat] += 1
+            self.__push(seat)
+
+    def weakest(
+            self,
+            exclude: Optional[player.Player] = None
+    ) -> Optional[player.Player]:
+        """
+        The Player with the lowest life plus shield
+
+        :param exclude: Optional[player.Player], a Player to ignore
+        :return: Optional[player.Player], the weakest Player
+        """
+        return self.__top(self.__min_hp, exclude)
+
+    def strongest(
+            self,
+            exclude: Optional[player.Player] = None
+    ) -> Optional[player.Player]:
+        """
+        The Player with the highest life plus shield
+
+        :param exclude: Optional[player.Player], a Player to ignore
+        :return: Optional[player.Player], the strongest Player
+        """
+        return self.__top(self.__max_hp, exclude)
+
+    def highest_shield(
+            self,
+            exclude: Optional[player.Player] = None
+    ) -> Optional[player.Player]:
+        """
+        The Player with the highest shield
+
+        :param exclude: Optional[player.Player], a Player to ignore
+        :return: Optional[player.Player], the Player with the highest shield
+        """
+        return self.__top(self.__max_shield, exclude)
+
+    def most_charged(
+            self,
+            exclude: Optional[player.Player] = None
+    ) -> Optional[player.Player]:
+        """
+        The Player with the highest charged attack, the strongest threat
+
+        :param exclude: Optional[player.Player], a Player to ignore
+        :return: Optional[player.Player], the most charged Player
+        """
+        return self.__top(self.__max_charge, exclude)
+
+    def below(self, threshold: int) -> List[player.Player]:
+        """
+        The Players with a life plus shield lower than a threshold
+
+        Only walks the part of the heap below the threshold,
+        the other Players are never visited.
+
+        :param threshold: int, the effective life threshold
+        :return: List[player.Player], the Players below the threshold
+        """
+        heap, found = self.__min_hp, []
+        stack = [0] if heap else []
+        while stack:
+            i = stack.pop()
+            key, seat, version = heap[i]
+            if key >= threshold:
+                continue
+
+            if self.__is_valid(seat, version):
+                found.append(self.__players[seat])
+
+            stack.extend(j for j in (2 * i + 1, 2 * i + 2) if j < len(heap))
+
+        return found
+
+    def __call__(
+            self,
+            board_obj: board.Board,
+            event: str,
+            data: Dict[str, Any]
+    ) -> None:
+        """
+        Board listener, see board.Board.add_listener()
+        """
+        if event in ('deal', 'custom', 'restore'):
+            self.build(board_obj)
+
+        elif event == 'elimination':
+            self.eliminate(data['player'])
+
+        elif event in ('attack', 'charge', 'swap'):
+            self.update(data['player'])
+            if 'target' in data:
+                self.update(data['target'])
+
+        elif event == 'undo':
+            for player_obj in data['players']:
+                self.revive(player_obj)
+                self.update(player_obj)
+
+    def __is_valid(self, seat: int, version: int) -> bool:
+        """
+        Whether a heap entry holds the current totals of a living seat
+        """
+        return self.__alive[seat] and self.__versions[seat] == version
+
+    def __push(self, seat: int) -> None:
+        """
+        Push the current totals of a seat in every heap, the heaps are
+        rebuilt when outdated entries pile up
+        """
+        version = self.__versions[seat]
+        hp = self.__life[seat] + self.__shield[seat]
+        heapq.heappush(self.__min_hp, (hp, seat, version))
+        heapq.heappush(self.__max_hp, (-hp, seat, version))
+        heapq.heappush(
+            self.__max_shield, (-self.__shield[seat], seat, version)
+        )
+        heapq.heappush(
+            self.__max_charge, (-self.__charge[seat], seat, version)
+        )
+
+        # every heap gets every push, but outdated entries are only popped
+        # from the queried heaps, the least queried one is the largest
+        largest = max(
+            len(self.__min_hp), len(self.__max_hp),
+            len(self.__max_shield), len(self.__max_charge)
+        )
+        if largest > 4 * self.__n_alive + 64:
+            self.__rebuild_heaps()
+
+    def __rebuild_heaps(self) -> None:
+        """
+        Build the heaps from the arrays, dropping outdated entries
+        """
+        seats = [s for s in range(len(self.__players)) if self.__alive[s]]
+        life, shield = self.__life, self.__shield
+        charge, versions = self.__charge, self.__versions
+
+        self.__min_hp[:] = [
+            (life[s] + shield[s], s, versions[s]) for s in seats
+        ]
+        self.__max_hp[:] = [
+            (-life[s] - shield[s], s, versions[s]) for s in seats
+        ]
+        self.__max_shield[:] = [(-shield[s], s, versions[s]) for s in seats]
+        self.__max_charge[:] = [(-charge[s], s, versions[s]) for s in seats]
+
+        for heap in (
+                self.__min_hp, self.__max_hp,
+                self.__max_shield, self.__max_charge
+        ):
+            heapq.heapify(heap)
+
+    def __top(
+            self,
+            heap: List[_Entry],
+            exclude: Optional[player.Player]
+    ) -> Optional[player.Player]:
+        """
+        The first valid seat of a heap, ignoring a given Player
+        """
+        excluded = -1 if exclude is None else self.__seats[id(exclude)]
+
+        # drop outdated entries from the top
+        while heap and not self.__is_valid(heap[0][1], heap[0][2]):
+            heapq.heappop(heap)
+
+        if not heap:
+            return None
+        if heap[0][1] != excluded:
+            return self.__players[heap[0][1]]
+
+        # the top is excluded, look for the next valid entry
+        top = heapq.heappop(heap)
+        while heap and not self.__is_valid(heap[0][1], heap[0][2]):
+            heapq.heappop(heap)
+        found = self.__players[heap[0][1]] if heap else None
+        heapq.heappush(heap, top)
+
+        return found